@@ -1,31 +1,102 @@
-def str_base(number,base):
-    def digit_to_char(digit):
-        if digit < 10:
-            return str(digit)
-        return chr(ord('a') + digit - 10)
-    if number < 0:
-        return '-' + str_base(-number, base)
-    (d, m) = divmod(number, base)
-    if d > 0:
-        return str_base(d, base) + digit_to_char(m)
-    return digit_to_char(m)
+"""Brute-force enumeration of Hog turn outcomes, used to check the closed-form
+counts in pascal.
 
-def chances(num_rolls, dice):
-    data = {}
-    for n in range(dice**num_rolls):
-        print(n)
-        combo = str_base(n, dice)
-        if '0' in combo:
-            result = 1
+All dice**num_rolls outcomes are enumerated in chunks: itertools.product runs
+over the first dice, and a NumPy grid covers as many of the last dice as fit
+in CHUNK_SIZE outcomes.  Only one chunk and the running counts are held in
+memory at a time.
+"""
+
+from itertools import product
+
+import numpy as np
+
+from pascal import get_counts
+from ucb import main
+
+CHUNK_SIZE = 10**5 # Most outcomes enumerated together in one NumPy chunk
+
+def chunk_rolls(num_rolls, dice):
+    """Return how many of NUM_ROLLS dice with DICE sides to enumerate in one
+    chunk: the most whose outcomes fit in CHUNK_SIZE, but at least one.
+
+    >>> chunk_rolls(10, 6), chunk_rolls(10, 20), chunk_rolls(2, 6)
+    (6, 3, 2)
+    """
+    tail = 1
+    while tail < num_rolls and dice ** (tail + 1) <= CHUNK_SIZE:
+        tail += 1
+    return tail
+
+def tail_grid(num_rolls, dice):
+    """Return two arrays over all outcomes of NUM_ROLLS dice with DICE sides:
+    the sum of each outcome and whether it contains a 1.
+
+    >>> sums, pig_outs = tail_grid(2, 3)
+    >>> sums.tolist()
+    [2, 3, 4, 3, 4, 5, 4, 5, 6]
+    >>> int(pig_outs.sum())
+    5
+    """
+    faces = np.indices((dice,) * num_rolls).reshape(num_rolls, -1) + 1
+    return faces.sum(axis=0), (faces == 1).any(axis=0)
+
+def count_outcomes(num_rolls, dice):
+    """Return a dictionary with the number of outcomes of rolling NUM_ROLLS
+    dice with DICE sides that score each number in hog, by enumerating every
+    outcome.
+
+    >>> count_outcomes(2, 3)
+    {1: 5, 2: 0, 3: 0, 4: 1, 5: 2, 6: 1}
+    """
+    tail = chunk_rolls(num_rolls, dice)
+    sums, pig_outs = tail_grid(tail, dice)
+    counts = np.zeros(num_rolls * dice + 1, dtype=np.int64)
+    for prefix in product(range(1, dice + 1), repeat=num_rolls - tail):
+        if 1 in prefix:
+            counts[1] += len(sums)
         else:
-            result = sum([int(d) + 1 for d in combo])
-        try:
-            data[result] += 1
-        except: 
-            data[result] = 1
-    data = {key : value/(dice**num_rolls -1) for key, value in data.items()}
-    for i in data.items():
-        print("{}:  {}".format(i))
-    return data
-
-chances(10, 6)
+            scores = np.where(pig_outs, 1, sums + sum(prefix))
+            counts += np.bincount(scores, minlength=len(counts))
+    return {n: int(counts[n]) for n in range(1, len(counts))}
+
+def chances(num_rolls, dice):
+    """Return a dictionary with the probability of scoring each number in hog
+    by rolling NUM_ROLLS dice with DICE sides, by enumerating every outcome.
+
+    >>> chances(1, 4)
+    {1: 0.25, 2: 0.25, 3: 0.25, 4: 0.25}
+    """
+    total = dice**num_rolls
+    return {n: count / total
+            for n, count in count_outcomes(num_rolls, dice).items()}
+
+def verify(num_rolls, dice):
+    """Return whether enumerating every outcome gives exactly the counts of
+    pascal.get_counts for NUM_ROLLS dice with DICE sides.
+
+    >>> all(verify(rolls, dice) for rolls in range(1, 5) for dice in (4, 6))
+    True
+    """
+    return count_outcomes(num_rolls, dice) == get_counts(num_rolls, dice)
+
+##########################
+# Command Line Interface #
+##########################
+
+@main
+def run(*args):
+    """Enumerate the outcomes of a turn and check them against pascal."""
+    import argparse
+    parser = argparse.ArgumentParser(description='Enumerate Hog turns')
+    parser.add_argument('num_rolls', type=int, help='number of dice rolled')
+    parser.add_argument('dice', type=int, help='number of sides on each die')
+    args = parser.parse_args()
+
+    for n, chance in chances(args.num_rolls, args.dice).items():
+        if chance:
+            print('{}:  {}'.format(n, chance))
+    if verify(args.num_rolls, args.dice):
+        print('Matches pascal.get_counts')
+    else:
+        print('Does not match pascal.get_counts')
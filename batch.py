@@ -0,0 +1,160 @@
+"""A vectorized Hog simulator that plays many games in lockstep.
+
+Every game in a batch takes its turns at the same time, so the whole batch is
+described by a pair of score arrays.  The special rules of hog.play (Free
+bacon, Hog wild and Swine swap) are applied to all games at once as array
+masks instead of one game at a time.  A rules.Rules object selects a variant
+of the game; its tables and turn distributions are prepared once per batch.
+"""
+
+from functools import lru_cache
+
+import numpy as np
+
+from compiled import compile_strategy
+from exact import turn_distribution
+from hog import GOAL_SCORE, always_roll
+from rules import STANDARD, standard_rules
+
+def strategy_table(strategy, goal=GOAL_SCORE, max_rolls=STANDARD.max_rolls):
+    """Return a GOAL x GOAL array whose [score, opponent_score] entry is the
+    number of dice, at most MAX_ROLLS, that STRATEGY rolls in that state.
+
+    STRATEGY is compiled with compiled.compile_strategy, which reuses the
+    table of a compiled strategy.  STRATEGY may also be such an array
+    already, in which case it is checked and returned as is.
+
+    >>> table = strategy_table(always_roll(3), 10)
+    >>> table.shape, int(table[9, 0])
+    ((10, 10), 3)
+    """
+    if not isinstance(strategy, np.ndarray):
+        strategy = compile_strategy(strategy, goal, max_rolls).table
+    assert strategy.shape == (goal, goal), 'Strategy table has the wrong shape.'
+    assert strategy.min() >= 0, 'Cannot roll a negative number of dice.'
+    assert strategy.max() <= max_rolls, \
+        'Cannot roll more than {} dice.'.format(max_rolls)
+    return strategy
+
+def bacon_table(goal=GOAL_SCORE, rules=STANDARD):
+    """Return an array of Free bacon points for every opponent score below
+    GOAL.
+
+    >>> [int(x) for x in bacon_table()[[0, 7, 34, 71]]]
+    [1, 8, 5, 8]
+    """
+    return np.array(rules.bacon[:goal])
+
+@lru_cache(maxsize=None)
+def turn_cdf(rules=STANDARD):
+    """Return the cumulative turn distributions under RULES for every number
+    of rolls, first for the wild dice and then for the usual dice, laid end
+    to end with row R offset by R so that one sorted array holds them all.
+    The array is cached and must not be changed.
+    """
+    rows = []
+    for sides in (rules.wild_sides, rules.sides):
+        for num_rolls in range(rules.max_rolls + 1):
+            cdf = np.ones(rules.max_points + 1) # Free bacon rows are never used
+            if num_rolls:
+                chances = turn_distribution(num_rolls, sides)[:-1]
+                cdf[:len(chances)] = np.cumsum(chances)
+            rows.append(cdf + len(rows))
+    return np.concatenate(rows)
+
+def roll_turns(num_rolls, wild, bacon, rng, rules=STANDARD):
+    """Return the points scored by a batch of turns, drawing each turn's
+    outcome at once from its exact distribution.
+
+    num_rolls:  Array of the number of dice rolled in each turn; 0 is Free
+                bacon.
+    wild:       Boolean array that is true for turns that roll the wild dice.
+    bacon:      Array of Free bacon points for each turn.
+    rng:        A numpy.random.Generator.
+    rules:      The rules.Rules of the game.
+    """
+    row = num_rolls + ~wild * (rules.max_rolls + 1)
+    width = rules.max_points + 1
+    points = np.searchsorted(turn_cdf(rules), row + rng.random(len(row)),
+                             side='right') - row * width
+    return np.where(num_rolls == 0, bacon, points)
+
+def play_batch(strategy0, strategy1, num_games, goal=GOAL_SCORE, seed=None,
+               observer=None, rules=None):
+    """Simulate NUM_GAMES games between STRATEGY0 and STRATEGY1 and return
+    two arrays of final scores, with Player 0's scores first.
+
+    Each strategy is compiled once with strategy_table, so it must be a
+    deterministic function of the two scores.  The outcomes follow the same
+    distribution as calling hog.play NUM_GAMES times.  An OBSERVER, such as
+    an observers.RuleCounter, is given a tally of every round of turns.
+    RULES, if given, replaces the standard rules played to GOAL.
+
+    >>> score0, score1 = play_batch(always_roll(5), always_roll(5), 100, seed=0)
+    >>> len(score0), bool((np.maximum(score0, score1) >= 100).all())
+    (100, True)
+    >>> from rules import Rules
+    >>> score0, score1 = play_batch(always_roll(4), always_roll(4), 100, seed=0,
+    ...                             rules=Rules(goal=300, sides=10))
+    >>> bool((np.maximum(score0, score1) >= 300).all())
+    True
+    """
+    if rules is None:
+        rules = standard_rules(goal)
+    goal = rules.goal
+    rng = np.random.default_rng(seed)
+    tables = (strategy_table(strategy0, goal, rules.max_rolls),
+              strategy_table(strategy1, goal, rules.max_rolls))
+    bacon, hog_wild = bacon_table(goal, rules), np.array(rules.hog_wild)
+    scores = np.zeros((2, num_games), dtype=np.int64)
+    playing = np.arange(num_games) # Indices of the games still in progress
+    who = 0
+    while playing.size:
+        score, opponent_score = scores[who, playing], scores[1 - who, playing]
+        num_rolls = tables[who][score, opponent_score]
+        wild = hog_wild[score + opponent_score]
+        score = score + roll_turns(num_rolls, wild, bacon[opponent_score], rng,
+                                   rules)
+        if rules.swine_swap:
+            swap = (np.maximum(score, opponent_score) ==
+                    2 * np.minimum(score, opponent_score))
+        else:
+            swap = np.zeros(len(score), dtype=bool)
+        scores[who, playing] = np.where(swap, opponent_score, score)
+        scores[1 - who, playing] = np.where(swap, score, opponent_score)
+        ongoing = np.maximum(score, opponent_score) < goal
+        if observer is not None:
+            observer.tally(len(playing), int(len(playing) - ongoing.sum()),
+                           int(wild.sum()), int((num_rolls == 0).sum()),
+                           int(swap.sum()))
+        playing = playing[ongoing]
+        who = 1 - who
+    return scores[0], scores[1]
+
+def winners(strategy0, strategy1, num_games, goal=GOAL_SCORE, seed=None,
+            rules=None):
+    """Return an array holding the winner (0 or 1) of each of NUM_GAMES games
+    between STRATEGY0 and STRATEGY1, decided as in hog.winner.
+    """
+    score0, score1 = play_batch(strategy0, strategy1, num_games, goal, seed,
+                                rules=rules)
+    return (score0 <= score1).astype(np.int8)
+
+def average_win_rate(strategy, baseline=always_roll(5), num_samples=10000,
+                     seed=None, rules=STANDARD):
+    """Return the average win rate (0 to 1) of STRATEGY against BASELINE,
+    playing NUM_SAMPLES games in each seat as hog.average_win_rate does,
+    under RULES.
+
+    >>> average_win_rate(always_roll(5), num_samples=2000, seed=1) > 0.45
+    True
+    """
+    rng = np.random.default_rng(seed)
+    seed0, seed1 = rng.integers(2**63, size=2)
+    table = strategy_table(strategy, rules.goal, rules.max_rolls)
+    baseline = strategy_table(baseline, rules.goal, rules.max_rolls)
+    win_rate_as_player_0 = 1 - winners(table, baseline, num_samples,
+                                       seed=seed0, rules=rules).mean()
+    win_rate_as_player_1 = winners(baseline, table, num_samples,
+                                   seed=seed1, rules=rules).mean()
+    return float(win_rate_as_player_0 + win_rate_as_player_1) / 2
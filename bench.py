@@ -0,0 +1,154 @@
+"""Benchmarks for the Hog simulator and strategies.
+
+Every benchmark reports the time of one operation in seconds, so lower is
+always better.  Results can be written as JSON and compared against a saved
+baseline to catch slowdowns:
+
+    python3 bench.py --output baseline.json
+    ... change something ...
+    python3 bench.py --baseline baseline.json
+"""
+
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+import timeit
+
+import hog
+from compiled import compile_strategy
+from ucb import main
+
+STRATEGIES = {
+    'always_roll(5)': hog.always_roll(5),
+    'bacon_strategy': hog.bacon_strategy,
+    'swap_strategy': hog.swap_strategy,
+    'final_strategy': hog.final_strategy,
+}
+
+def time_per_call(fn, repeat=5):
+    """Return the best time in seconds of one call to FN, a function of no
+    arguments, over REPEAT timing runs."""
+    timer = timeit.Timer(fn)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat, number)) / number
+
+def strategy_latency(strategy):
+    """Return the time of one call to STRATEGY, averaged over all states."""
+    states = [(score, opponent_score) for score in range(hog.GOAL_SCORE)
+              for opponent_score in range(hog.GOAL_SCORE)]
+    return time_per_call(lambda: [strategy(*state) for state in states]) / \
+           len(states)
+
+def take_turn_latency():
+    """Return the time of one take_turn, averaged over 0 to 10 dice."""
+    return time_per_call(lambda: [hog.take_turn(n, 42) for n in range(11)]) / 11
+
+def play_latency(strategy=hog.final_strategy, baseline=hog.always_roll(5)):
+    """Return the time of one game of STRATEGY against BASELINE."""
+    return time_per_call(lambda: hog.play(strategy, baseline))
+
+def average_win_rate_time(strategy=hog.final_strategy):
+    """Return the time of one call to average_win_rate for STRATEGY."""
+    start = time.perf_counter()
+    hog.average_win_rate(strategy)
+    return time.perf_counter() - start
+
+def import_times(module):
+    """Return a dict from the name of every module loaded by importing MODULE
+    in a new interpreter to the seconds its import took, including the
+    modules it imported, but not the startup of the interpreter itself.
+
+    Importing hog must stay well under 100 ms, without any heavy modules:
+
+    >>> times = import_times('hog')
+    >>> times['hog'] < 0.1
+    True
+    >>> sorted(set(times) & {'numpy', 'fractions', 'inspect', 'json'})
+    []
+    """
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c',
+                             'import ' + module],
+                            cwd=os.path.dirname(os.path.abspath(__file__)),
+                            stderr=subprocess.PIPE, universal_newlines=True,
+                            check=True)
+    times = {}
+    for line in result.stderr.splitlines()[1:]: # Skip the column names
+        _, cumulative, name = line.split(':', 1)[1].split('|')
+        times[name.strip()] = int(cumulative) / 1e6
+    return times
+
+def run_benchmarks(quick=False, seed=0):
+    """Return a dict from benchmark names to seconds per operation.  QUICK
+    skips the slow average_win_rate benchmark."""
+    random.seed(seed)
+    results = {}
+    for name, strategy in STRATEGIES.items():
+        results['strategy:' + name] = strategy_latency(strategy)
+        compiled = compile_strategy(strategy)
+        results['compiled:' + name] = strategy_latency(compiled)
+    results['take_turn'] = take_turn_latency()
+    results['play'] = play_latency()
+    results['import:hog'] = import_times('hog')['hog']
+    if not quick:
+        results['average_win_rate'] = average_win_rate_time()
+    return results
+
+def compare(results, baseline, tolerance=0.1):
+    """Return a list of (name, baseline time, time) for each benchmark in
+    RESULTS that is more than TOLERANCE (a fraction) slower than BASELINE.
+
+    >>> compare({'play': 1.2, 'new': 9.0}, {'play': 1.0}, tolerance=0.1)
+    [('play', 1.0, 1.2)]
+    """
+    return [(name, baseline[name], seconds)
+            for name, seconds in sorted(results.items())
+            if name in baseline and seconds > baseline[name] * (1 + tolerance)]
+
+def print_results(results, baseline=None):
+    """Print each result, and its change from BASELINE if given."""
+    for name, seconds in sorted(results.items()):
+        line = '{:<30} {:>12.3f} us  {:>14,.0f} per second'.format(
+            name, seconds * 1e6, 1 / seconds)
+        if baseline and name in baseline:
+            line += '  {:+7.1%}'.format(seconds / baseline[name] - 1)
+        print(line)
+
+##########################
+# Command Line Interface #
+##########################
+
+@main
+def run(*args):
+    """Run the benchmarks and compare them with a saved baseline."""
+    import argparse
+    parser = argparse.ArgumentParser(description='Benchmark Hog')
+    parser.add_argument('--output', '-o', help='write results as JSON here')
+    parser.add_argument('--baseline', '-b', help='JSON results to compare with')
+    parser.add_argument('--tolerance', '-t', type=float, default=0.1,
+                        help='allowed slowdown before a regression, e.g. 0.1')
+    parser.add_argument('--quick', '-q', action='store_true',
+                        help='skip the slow average_win_rate benchmark')
+    args = parser.parse_args()
+
+    results = run_benchmarks(args.quick)
+    baseline = None
+    if args.baseline:
+        with open(args.baseline) as baseline_file:
+            baseline = json.load(baseline_file)['results']
+    print_results(results, baseline)
+    if args.output:
+        with open(args.output, 'w') as output_file:
+            json.dump({'python': platform.python_version(),
+                       'machine': platform.machine(),
+                       'results': results}, output_file, indent=2)
+    if baseline:
+        regressions = compare(results, baseline, args.tolerance)
+        for name, before, after in regressions:
+            print('Regression: {} went from {:.3f} us to {:.3f} us'.format(
+                name, before * 1e6, after * 1e6))
+        if regressions:
+            sys.exit(1)
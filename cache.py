@@ -0,0 +1,173 @@
+"""A persistent cache for the results of expensive experiments.
+
+Results are stored in a SQLite file, keyed by the function, its arguments
+(with defaults filled in) and the source code of every project module that
+is loaded, so editing a strategy, an experiment or anything they use makes
+their old results unreachable.  Only calls with a SEED argument are cached,
+since the result of an unseeded experiment is just one random sample.
+When the cache grows past its size limits, the least recently used results
+are evicted.  Anything an experiment prints is stored too and printed
+again when the result is reused.
+"""
+
+import contextlib
+import hashlib
+import inspect
+import io
+import os
+import pickle
+import sqlite3
+import sys
+import time
+from functools import lru_cache, wraps
+
+PROJECT_DIR = os.path.dirname(os.path.abspath(__file__))
+CACHE_PATH = os.path.join(PROJECT_DIR, '.hog_cache.sqlite')
+MAX_ENTRIES = 10000
+MAX_BYTES = 64 * 1024 * 1024
+
+@lru_cache(maxsize=None)
+def file_hash(path):
+    """Return a hash of the contents of the file at PATH."""
+    with open(path, 'rb') as source_file:
+        return hashlib.sha1(source_file.read()).hexdigest()
+
+def project_hash():
+    """Return a hash of the sources of every loaded module of this project,
+    which include all the modules that an experiment has imported."""
+    paths = set()
+    for module in list(sys.modules.values()):
+        path = getattr(module, '__file__', None)
+        if path and os.path.dirname(os.path.abspath(path)) == PROJECT_DIR:
+            paths.add(os.path.abspath(path))
+    digest = hashlib.sha1()
+    for path in sorted(paths):
+        digest.update(file_hash(path).encode())
+    return digest.hexdigest()
+
+def describe(value):
+    """Return a string that identifies VALUE for a cache key.  A function is
+    described by its name, the source of the file that defines it and the
+    values it closes over; a fair die by its number of sides.
+
+    >>> from dice import make_fair_dice
+    >>> describe(make_fair_dice(6)), describe((1, 'a'))
+    ('dice(6)', "tuple(1, 'a')")
+    >>> from hog import always_roll
+    >>> describe(always_roll(5)) == describe(always_roll(5))
+    True
+    >>> describe(always_roll(5)) == describe(always_roll(6))
+    False
+    """
+    if isinstance(value, (tuple, list)):
+        return '{}({})'.format(type(value).__name__,
+                               ', '.join(map(describe, value)))
+    if not callable(value):
+        return repr(value)
+    if hasattr(value, 'sides'):
+        return 'dice({})'.format(value.sides)
+    try:
+        source = file_hash(inspect.getsourcefile(value))
+    except (TypeError, OSError):
+        source = ''
+    cells = [cell.cell_contents for cell in getattr(value, '__closure__', None)
+             or () if cell.cell_contents is not value]
+    return '{}.{}[{}]({})'.format(getattr(value, '__module__', ''),
+                                  getattr(value, '__qualname__', repr(value)),
+                                  source, ', '.join(map(describe, cells)))
+
+def cache_key(fn, args, kwargs):
+    """Return the cache key for calling FN with ARGS and KWARGS, or None if
+    the call has no SEED argument.
+
+    >>> def experiment(x, seed=0):
+    ...     return x
+    >>> cache_key(experiment, (1,), {}) == cache_key(experiment, (1,), {})
+    True
+    >>> cache_key(experiment, (1,), {}) == cache_key(experiment, (1, 2), {})
+    False
+    >>> cache_key(experiment, (1, None), {}) is None
+    True
+    """
+    try:
+        bound = inspect.signature(fn).bind(*args, **kwargs)
+        bound.apply_defaults()
+        arguments = sorted(bound.arguments.items())
+    except (TypeError, ValueError):
+        arguments = [(i, arg) for i, arg in enumerate(args)]
+        arguments += sorted(kwargs.items())
+    if dict(arguments).get('seed') is None:
+        return None
+    text = project_hash() + describe(fn)
+    text += ''.join('|{}={}'.format(name, describe(value))
+                    for name, value in arguments)
+    return hashlib.sha1(text.encode()).hexdigest()
+
+def connect(path):
+    """Return a connection to the cache database at PATH."""
+    connection = sqlite3.connect(path)
+    connection.execute('CREATE TABLE IF NOT EXISTS results (key TEXT PRIMARY '
+                       'KEY, value BLOB, size INTEGER, used REAL)')
+    return connection
+
+def evict(connection, max_entries=MAX_ENTRIES, max_bytes=MAX_BYTES):
+    """Delete least recently used results until at most MAX_ENTRIES results
+    of at most MAX_BYTES bytes in total remain."""
+    rows = connection.execute('SELECT key, size FROM results '
+                              'ORDER BY used DESC').fetchall()
+    total, stale = 0, []
+    for count, (key, size) in enumerate(rows):
+        total += size
+        if count >= max_entries or total > max_bytes:
+            stale.append((key,))
+    connection.executemany('DELETE FROM results WHERE key = ?', stale)
+
+def cached(fn, path=CACHE_PATH, max_entries=MAX_ENTRIES, max_bytes=MAX_BYTES):
+    """Return a version of FN whose results, and the output it prints, are
+    kept in the cache at PATH and reused when it is called again with the
+    same arguments.  Calls without a SEED argument are not cached.
+
+    >>> import os, tempfile
+    >>> path = os.path.join(tempfile.mkdtemp(), 'cache.sqlite')
+    >>> def square(x, seed=0):
+    ...     print('squaring', x)
+    ...     return x * x
+    >>> cached_square = cached(square, path)
+    >>> cached_square(3)
+    squaring 3
+    9
+    >>> cached_square(3)
+    squaring 3
+    9
+    >>> cached_square(4, seed=None)
+    squaring 4
+    16
+    >>> len(connect(path).execute('SELECT * FROM results').fetchall())
+    1
+    """
+    @wraps(fn)
+    def wrapped(*args, **kwargs):
+        key = cache_key(fn, args, kwargs)
+        if key is None:
+            return fn(*args, **kwargs)
+        with contextlib.closing(connect(path)) as connection, connection:
+            row = connection.execute('SELECT value FROM results WHERE key = ?',
+                                     (key,)).fetchone()
+            if row is not None:
+                connection.execute('UPDATE results SET used = ? WHERE key = ?',
+                                   (time.time(), key))
+                result, output = pickle.loads(row[0])
+                print(output, end='')
+                return result
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            result = fn(*args, **kwargs)
+        print(output.getvalue(), end='')
+        value = pickle.dumps((result, output.getvalue()))
+        with contextlib.closing(connect(path)) as connection, connection:
+            connection.execute('INSERT OR REPLACE INTO results VALUES '
+                               '(?, ?, ?, ?)', (key, value, len(value),
+                                                time.time()))
+            evict(connection, max_entries, max_bytes)
+        return result
+    return wrapped
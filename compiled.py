@@ -0,0 +1,71 @@
+"""Compile strategies into lookup tables.
+
+A strategy is a function of the two scores, so it can be evaluated once in
+every state below the goal and replaced by a table.  The compiled strategy
+does one lookup per decision, and its TABLE attribute holds the raw GOAL x
+GOAL array of rolls for the batch engine and the other table-driven tools.
+"""
+
+import numpy as np
+
+from hog import GOAL_SCORE
+from rules import STANDARD
+
+def tabulate(strategy, goal=GOAL_SCORE, max_rolls=STANDARD.max_rolls):
+    """Return a GOAL x GOAL array whose [score, opponent_score] entry is the
+    number of dice, at most MAX_ROLLS, that STRATEGY rolls in that state."""
+    table = np.array([[strategy(score, opponent_score)
+                       for opponent_score in range(goal)]
+                      for score in range(goal)])
+    assert table.dtype.kind in 'iu', 'A strategy must return integers.'
+    assert table.min() >= 0, 'Cannot roll a negative number of dice.'
+    assert table.max() <= max_rolls, \
+        'Cannot roll more than {} dice.'.format(max_rolls)
+    return table.astype(np.uint8)
+
+def table_strategy(table):
+    """Return a strategy that rolls the number of dice in TABLE, a square
+    2-D array indexed by [score, opponent_score].
+
+    >>> strategy = table_strategy(np.array([[3, 0], [1, 2]]))
+    >>> strategy(1, 0), strategy.goal
+    (1, 2)
+    """
+    table = np.asarray(table, dtype=np.uint8)
+    assert table.ndim == 2 and table.shape[0] == table.shape[1], \
+        'A strategy table must be square.'
+    rows = table.tolist()
+    def strategy(score, opponent_score):
+        return rows[score][opponent_score]
+    strategy.table = table
+    strategy.goal = len(table)
+    return strategy
+
+def compile_strategy(strategy, goal=GOAL_SCORE, max_rolls=STANDARD.max_rolls):
+    """Return a table-backed strategy that rolls the same number of dice as
+    STRATEGY, at most MAX_ROLLS, in every state with both scores below GOAL.
+
+    STRATEGY is evaluated twice in every state to check that it is
+    deterministic.  Compiled strategies are returned unchanged.
+
+    >>> from hog import final_strategy
+    >>> compiled = compile_strategy(final_strategy)
+    >>> compiled(42, 71) == final_strategy(42, 71), compiled.table.shape
+    (True, (100, 100))
+    >>> compile_strategy(compiled) is compiled
+    True
+    >>> import random
+    >>> compile_strategy(lambda score, opponent_score: random.randrange(11))
+    Traceback (most recent call last):
+        ...
+    AssertionError: The strategy is not deterministic.
+    """
+    if getattr(strategy, 'goal', None) == goal and hasattr(strategy, 'table'):
+        return strategy
+    table = tabulate(strategy, goal, max_rolls)
+    assert np.array_equal(table, tabulate(strategy, goal, max_rolls)), \
+        'The strategy is not deterministic.'
+    compiled = table_strategy(table)
+    compiled.__name__ = getattr(strategy, '__name__', compiled.__name__)
+    compiled.__doc__ = getattr(strategy, '__doc__', None)
+    return compiled
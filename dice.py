@@ -12,13 +12,50 @@ Types of dice:
     cycle among a fixed set of values when rolled.
 """
 
-from random import randint
+from random import choices, randbytes, randint
 
 def make_fair_dice(sides):
     """Return a die that returns 1 to SIDES with equal chance."""
     assert type(sides) == int and sides >= 1, 'Illegal value for sides'
     def dice():
         return randint(1,sides)
+    dice.sides = sides
+    return dice
+
+def make_buffered_dice(sides, buffer_size=1024):
+    """Return a die that returns 1 to SIDES with equal chance, like
+    make_fair_dice, but draws its outcomes from the random module about
+    BUFFER_SIZE at a time and returns them one per call.
+
+    Outcomes drawn before random.seed is called are still returned after it,
+    so buffered dice are opt-in: make new ones after seeding, as
+    parallel.play_games and gamelog.play_games do.
+
+    >>> dice = make_buffered_dice(4)
+    >>> sorted(set(dice() for _ in range(1000)))
+    [1, 2, 3, 4]
+    """
+    assert type(sides) == int and sides >= 1, 'Illegal value for sides'
+    if sides <= 256:
+        # Each random byte below the largest multiple of SIDES maps to an
+        # outcome, and the remaining bytes are dropped so that all outcomes
+        # are equally likely.
+        limit = 256 - 256 % sides
+        outcomes = bytes(b % sides + 1 for b in range(limit)) + \
+                   bytes(256 - limit)
+        dropped = bytes(range(limit, 256))
+        refill = lambda: randbytes(buffer_size).translate(outcomes, dropped)
+    else:
+        refill = lambda: choices(range(1, sides + 1), k=buffer_size)
+    buffer = iter(())
+    def dice():
+        nonlocal buffer
+        try:
+            return next(buffer)
+        except StopIteration:
+            buffer = iter(refill())
+            return next(buffer)
+    dice.sides = sides
     return dice
 
 four_sided = make_fair_dice(4)
@@ -0,0 +1,81 @@
+"""Exact turn-score distributions for Hog, computed without simulation."""
+
+from bisect import bisect
+from functools import lru_cache
+from itertools import accumulate
+from random import random
+
+from pascal import get_probabilities
+
+@lru_cache(maxsize=None)
+def turn_distribution(num_rolls, sides):
+    """Return a tuple whose Nth entry is the chance of scoring N points by
+    rolling NUM_ROLLS fair dice with SIDES sides (Pig out included).
+
+    >>> [round(p, 4) for p in turn_distribution(1, 6)]
+    [0.0, 0.1667, 0.1667, 0.1667, 0.1667, 0.1667, 0.1667]
+    >>> round(sum(turn_distribution(10, 4)), 10)
+    1.0
+    """
+    assert num_rolls > 0, 'Must roll at least once.'
+    probabilities = get_probabilities(num_rolls, sides)
+    return (0.0,) + tuple(probabilities[n]
+                          for n in range(1, num_rolls * sides + 1))
+
+@lru_cache(maxsize=None)
+def average_roll(num_rolls, sides):
+    """Return the expected value of roll_dice(NUM_ROLLS, dice) for a fair
+    die with SIDES sides.
+
+    >>> average_roll(1, 6)
+    3.5
+    >>> max(range(1, 11), key=lambda n: average_roll(n, 6))
+    6
+    """
+    return sum(n * p for n, p in enumerate(turn_distribution(num_rolls, sides)))
+
+@lru_cache(maxsize=None)
+def cumulative_distribution(num_rolls, sides):
+    """Return the running totals of turn_distribution(NUM_ROLLS, SIDES)."""
+    return tuple(accumulate(turn_distribution(num_rolls, sides)))[:-1]
+
+def sample_roll(num_rolls, sides):
+    """Return the score of rolling NUM_ROLLS fair dice with SIDES sides,
+    drawn with a single random number from the exact turn distribution.
+
+    >>> from random import seed
+    >>> seed(61)
+    >>> scores = [sample_roll(2, 4) for _ in range(1000)]
+    >>> sorted(set(scores))
+    [1, 4, 5, 6, 7, 8]
+    """
+    return bisect(cumulative_distribution(num_rolls, sides), random())
+
+def make_averaged(fn):
+    """Return a function that returns the exact average value of FN when
+    called, where FN is hog.roll_dice or hog.take_turn rolling fair dice.
+
+    >>> import hog
+    >>> make_averaged(hog.roll_dice)(2, hog.four_sided)
+    3.8125
+    >>> make_averaged(hog.take_turn)(0, 34)
+    5
+    >>> from rules import Rules
+    >>> make_averaged(hog.take_turn)(2, 34, hog.dice_with(8), Rules(sides=8))
+    7.890625
+    """
+    import hog
+    assert fn in (hog.roll_dice, hog.take_turn), 'Cannot average ' + fn.__name__
+
+    def averaged(*args):
+        if fn is hog.take_turn:
+            num_rolls, opponent_score, *dice = args
+            if num_rolls == 0:
+                return hog.take_turn(*args)
+            dice = dice[:1]
+        else:
+            num_rolls, *dice = args
+        dice = dice[0] if dice else hog.six_sided
+        assert hasattr(dice, 'sides'), 'Only fair dice have exact averages.'
+        return average_roll(num_rolls, dice.sides)
+    return averaged
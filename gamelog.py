@@ -0,0 +1,186 @@
+"""Compact binary logs of Hog games, and their replay through hog.play.
+
+A game log file starts with a 5-byte header and is followed by one record
+per game, appended as games are played.  A record holds the seed the game
+was played with, the number of turns, and two bytes per turn: the number of
+dice rolled in the high 4 bits and the points scored in the low 12 bits.
+The record is enough to replay the game through hog.play without the
+strategies that played it.
+"""
+
+import os
+import random
+import struct
+from collections import namedtuple
+
+import hog
+from dice import make_buffered_dice
+from observers import Observer
+
+MAGIC = b'HOGL'
+VERSION = 1
+HEADER = struct.Struct('<4sB')  # magic, version
+RECORD = struct.Struct('<QH')   # seed, number of turns
+TURN_BITS = 12                  # Bits for the points scored in a turn
+
+Game = namedtuple('Game', ['seed', 'turns']) # turns: (num_rolls, points) pairs
+
+def encode(game):
+    """Return the bytes of the record for GAME.
+
+    >>> encode(Game(7, ((5, 12), (0, 1))))
+    b'\\x07\\x00\\x00\\x00\\x00\\x00\\x00\\x00\\x02\\x00\\x0cP\\x01\\x00'
+    """
+    turns = [num_rolls << TURN_BITS | points for num_rolls, points in game.turns]
+    return RECORD.pack(game.seed, len(turns)) + \
+           struct.pack('<{}H'.format(len(turns)), *turns)
+
+def read_games(path):
+    """Yield each Game in the log file at PATH, reading one record at a time.
+    """
+    with open(path, 'rb') as log_file:
+        magic, version = HEADER.unpack(log_file.read(HEADER.size))
+        assert magic == MAGIC, path + ' is not a Hog game log.'
+        assert version == VERSION, 'Unsupported game log version.'
+        mask = (1 << TURN_BITS) - 1
+        while True:
+            record = log_file.read(RECORD.size)
+            if not record:
+                return
+            seed, num_turns = RECORD.unpack(record)
+            turns = struct.unpack('<{}H'.format(num_turns),
+                                  log_file.read(2 * num_turns))
+            yield Game(seed, tuple((turn >> TURN_BITS, turn & mask)
+                                   for turn in turns))
+
+class GameLog(object):
+    """An append-only game log file at PATH."""
+
+    def __init__(self, path):
+        new = not os.path.exists(path) or os.path.getsize(path) == 0
+        self.file = open(path, 'ab')
+        if new:
+            self.file.write(HEADER.pack(MAGIC, VERSION))
+
+    def write(self, game):
+        """Append GAME to the log."""
+        self.file.write(encode(game))
+
+    def close(self):
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+class GameRecorder(Observer):
+    """An observer that passes each game it watches to LOG, which may be a
+    GameLog or any object with a write method, such as a list's append.
+    SEED is stored with the next game."""
+
+    def __init__(self, log, seed=0):
+        self.log, self.seed = log, seed
+        self.turns = []
+
+    def dice_selected(self, who, strategy, num_rolls, seconds):
+        self.num_rolls = num_rolls
+
+    def turn_end(self, who, points, score0, score1):
+        self.turns.append((self.num_rolls, points))
+
+    def game_end(self, score0, score1):
+        write = getattr(self.log, 'write', self.log)
+        write(Game(self.seed, tuple(self.turns)))
+        self.turns = []
+
+def play_games(strategy0, strategy1, num_games, seed=0):
+    """Play NUM_GAMES games between STRATEGY0 and STRATEGY1 and yield each
+    one as a Game.  Game I is played with dice seeded with SEED + I, so it
+    can also be played again from its seed.
+
+    >>> [game.seed for game in play_games(hog.always_roll(5),
+    ...                                   hog.always_roll(5), 3, seed=10)]
+    [10, 11, 12]
+    """
+    games = []
+    recorder = GameRecorder(games.append)
+    for i in range(num_games):
+        saved_dice = hog.four_sided, hog.six_sided
+        try:
+            recorder.seed = seed + i
+            random.seed(seed + i)
+            hog.four_sided = make_buffered_dice(4)
+            hog.six_sided = make_buffered_dice(6)
+            hog.play(strategy0, strategy1, observer=recorder)
+        finally:
+            hog.four_sided, hog.six_sided = saved_dice
+        yield games.pop()
+
+def record_games(strategy0, strategy1, num_games, path, seed=0):
+    """Play NUM_GAMES games between STRATEGY0 and STRATEGY1 and append them to
+    the game log at PATH, seeded as in play_games.
+    """
+    with GameLog(path) as log:
+        for game in play_games(strategy0, strategy1, num_games, seed):
+            log.write(game)
+
+def replay_faces(num_rolls, points):
+    """Return dice outcomes for a turn rolling NUM_ROLLS dice that scores
+    POINTS, using faces no higher than 4 when possible so that they suit
+    four-sided dice.  A Free bacon turn rolls no dice.  A Pig out rolls its 1
+    last, so that every face is used even when hog.FAST_ROLLS stops rolling
+    at the first 1.
+
+    >>> replay_faces(3, 1), replay_faces(3, 11), replay_faces(3, 16)
+    ([2, 2, 1], [4, 4, 3], [6, 6, 4])
+    """
+    if num_rolls == 0:
+        return []
+    if points == 1:
+        return [2] * (num_rolls - 1) + [1]
+    faces, extra = [2] * num_rolls, points - 2 * num_rolls
+    for highest in (4, 6):
+        for i in range(num_rolls):
+            raise_by = min(extra, highest - faces[i])
+            faces[i] += raise_by
+            extra -= raise_by
+    assert extra == 0, 'No dice can score {} points'.format(points)
+    return faces
+
+def replay(game, observer=None):
+    """Play GAME again through hog.play, with strategies and dice that repeat
+    its recorded turns, and return the final scores.
+
+    >>> games = []
+    >>> scores = hog.play(hog.always_roll(3), hog.bacon_strategy,
+    ...                   observer=GameRecorder(games.append))
+    >>> replayed = []
+    >>> replay(games[0], GameRecorder(replayed.append)) == scores
+    True
+    >>> encode(replayed[0]) == encode(games[0])
+    True
+    >>> hog.FAST_ROLLS = True
+    >>> all(verify(game) for game in play_games(hog.always_roll(4),
+    ...                                         hog.bacon_strategy, 20))
+    True
+    >>> hog.FAST_ROLLS = False
+    """
+    rolls = iter([num_rolls for num_rolls, _ in game.turns])
+    faces = iter([face for turn in game.turns for face in replay_faces(*turn)])
+    strategy = lambda score, opponent_score: next(rolls)
+    dice = lambda: next(faces)
+    saved_dice = hog.four_sided, hog.six_sided
+    hog.four_sided = hog.six_sided = dice
+    try:
+        return hog.play(strategy, strategy, observer=observer)
+    finally:
+        hog.four_sided, hog.six_sided = saved_dice
+
+def verify(game):
+    """Return whether replaying GAME through hog.play records it again byte
+    for byte."""
+    replayed = []
+    replay(game, GameRecorder(replayed.append, game.seed))
+    return encode(replayed[0]) == encode(game)
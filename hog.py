@@ -3,11 +3,20 @@
 #  Name: Ajai Sharma
 #  Email: ajai.sharma@gmail.com
 
-from dice import four_sided, six_sided, make_test_dice
+from functools import lru_cache
+
+from dice import four_sided, six_sided, make_test_dice, make_fair_dice
+from exact import sample_roll
+from rules import STANDARD, standard_rules, free_bacon, is_hog_wild, is_swap
 from ucb import main, trace, log_current_line, interact
 
 GOAL_SCORE = 100 # The goal of Hog is to score 100 points.
 
+# Set to True for large simulations: fair-dice turns are then drawn in one step
+# from their exact distribution, and other dice stop rolling after a Pig out.
+# Dice are no longer called exactly NUM_ROLLS times, so tests leave it False.
+FAST_ROLLS = False
+
 ######################
 # Phase 1: Simulator #
 ######################
@@ -16,7 +25,10 @@ GOAL_SCORE = 100 # The goal of Hog is to score 100 points.
 
 def roll_dice(num_rolls, dice=six_sided):
     """Roll DICE for NUM_ROLLS times.  Return either the sum of the outcomes,
-    or 1 if a 1 is rolled (Pig out). This calls DICE exactly NUM_ROLLS times.
+    or 1 if a 1 is rolled (Pig out). This calls DICE exactly NUM_ROLLS times,
+    unless FAST_ROLLS is true: then it stops calling DICE at the first 1, and
+    fair dice are not called at all, since the outcome is sampled directly
+    from its exact distribution.
 
     num_rolls:  The number of dice rolls that will be made; at least 1.
     dice:       A zero-argument function that returns an integer outcome.
@@ -26,45 +38,68 @@ def roll_dice(num_rolls, dice=six_sided):
     assert type(num_rolls) == int, 'num_rolls must be an integer.'
     assert num_rolls > 0, 'Must roll at least once.'
 
+    if FAST_ROLLS and hasattr(dice, 'sides'):
+        return sample_roll(num_rolls, dice.sides)
     result = 0
     for i in range(num_rolls):
         roll = dice()
         if roll == 1:
-            for j in range(num_rolls - i - 1):
-                dice()
+            if not FAST_ROLLS:
+                for j in range(num_rolls - i - 1):
+                    dice()
             return 1
         else: result += roll
     return result
 
 
-def take_turn(num_rolls, opponent_score, dice=six_sided):
+def take_turn(num_rolls, opponent_score, dice=six_sided, rules=STANDARD):
     """Simulate a turn rolling NUM_ROLLS dice, which may be 0 (Free bacon).
 
     num_rolls:       The number of dice rolls that will be made.
     opponent_score:  The total score of the opponent.
     dice:            A function of no args that returns an integer outcome.
+    rules:           The rules.Rules of the game.
     """
     assert type(num_rolls) == int, 'num_rolls must be an integer.'
     assert num_rolls >= 0, 'Cannot roll a negative number of dice.'
-    assert num_rolls <= 10, 'Cannot roll more than 10 dice.'
-    assert opponent_score < 100, 'The game should be over.'
+    assert num_rolls <= rules.max_rolls, \
+        'Cannot roll more than {} dice.'.format(rules.max_rolls)
+    assert opponent_score < rules.goal, 'The game should be over.'
 
     if num_rolls == 0:
-        return 1 + max([int(c) for c in str(opponent_score)])
+        return rules.bacon[opponent_score]
     else:
         return roll_dice(num_rolls, dice)
 
 # Playing a game
 
-def select_dice(score, opponent_score):
+def select_dice(score, opponent_score, rules=STANDARD):
     """Select six-sided dice unless the sum of SCORE and OPPONENT_SCORE is a
-    multiple of 7, in which case select four-sided dice (Hog wild).
+    multiple of 7, in which case select four-sided dice (Hog wild).  Other
+    RULES may change the dice and the modulus.
     """
 
-    if (score + opponent_score) % 7 == 0:
-        return four_sided
+    if rules.hog_wild[score + opponent_score]:
+        return dice_with(rules.wild_sides)
     else:
+        return dice_with(rules.sides)
+
+def dice_with(sides):
+    """Return the fair dice with SIDES sides.  Four- and six-sided dice are
+    the module's four_sided and six_sided, looked up on every call so that
+    they can be replaced.
+
+    >>> dice_with(6) is six_sided, dice_with(8).sides
+    (True, 8)
+    """
+    if sides == 6:
         return six_sided
+    elif sides == 4:
+        return four_sided
+    else:
+        return other_dice(sides)
+
+other_dice = lru_cache(maxsize=None)(make_fair_dice)
 
 def other(who):
     """Return the other player, for a player WHO numbered 0 or 1.
@@ -76,7 +111,7 @@ def other(who):
     """
     return 1 - who
 
-def play(strategy0, strategy1, goal=GOAL_SCORE):
+def play(strategy0, strategy1, goal=GOAL_SCORE, observer=None, rules=None):
     """Simulate a game and return the final scores of both players, with
     Player 0's score first, and Player 1's score second.
 
@@ -86,21 +121,80 @@ def play(strategy0, strategy1, goal=GOAL_SCORE):
 
     strategy0:  The strategy function for Player 0, who plays first.
     strategy1:  The strategy function for Player 1, who plays second.
+    goal:       The score needed to win, under the standard rules.
+    observer:   An optional observers.Observer that is told about each turn.
+    rules:      The rules.Rules of the game, including its goal, if not the
+                standard rules.
+
+    >>> from rules import Rules
+    >>> play(always_roll(0), always_roll(0), rules=Rules(goal=20))
+    (20, 8)
+    >>> max(play(final_strategy, always_roll(5), rules=Rules(goal=500))) >= 500
+    True
     """
+    if rules is None:
+        rules = standard_rules(goal)
+    if observer is not None:
+        return play_observed(strategy0, strategy1, observer, rules)
     who = 0  # Which player is about to take a turn, 0 (first) or 1 (second)
     scorelist = [0, 0]
     stratlist = [strategy0, strategy1]
-    
+    goal = rules.goal
+
+    while max(scorelist) < goal:
+        num_rolls = stratlist[who](scorelist[who], scorelist[other(who)])
+        play_turn(num_rolls, who, scorelist, rules)
+        who = other(who)
+    return scorelist[0], scorelist[1]
+
+def play_turn(num_rolls, who, scorelist, rules=STANDARD):
+    """Take a turn of NUM_ROLLS dice for player WHO, adding the points to
+    SCORELIST and then swapping it if Swine swap applies.  Return the points
+    scored and whether the scores were swapped.
+
+    >>> scorelist = [10, 11]
+    >>> play_turn(0, 1, scorelist), scorelist
+    ((2, False), [10, 13])
+    >>> play_turn(0, 0, scorelist), scorelist
+    ((4, False), [14, 13])
+    """
+    score, opponent_score = scorelist[who], scorelist[other(who)]
+    dice = select_dice(score, opponent_score, rules)
+    points = take_turn(num_rolls, opponent_score, dice, rules)
+    scorelist[who] += points
+    swapped = rules.swap[scorelist[0]][scorelist[1]]
+    if swapped:
+        scorelist[0], scorelist[1] = scorelist[1], scorelist[0]
+    return points, bool(swapped)
+
+def play_observed(strategy0, strategy1, observer, rules=STANDARD):
+    """Simulate a game exactly as play does, with the same play_turn, but
+    report each turn, the time each strategy takes to choose, and every
+    special rule that applies, to OBSERVER.  This is a separate loop so that
+    play pays nothing for it.
+    """
+    from time import perf_counter
+    who = 0
+    scorelist = [0, 0]
+    stratlist = [strategy0, strategy1]
 
-    while max(scorelist) < 100:
+    while max(scorelist) < rules.goal:
         score, opponent_score = scorelist[who], scorelist[other(who)]
+        observer.turn_start(who, score, opponent_score)
         strat = stratlist[who]
+        start = perf_counter()
         num_rolls = strat(score, opponent_score)
-        dice = select_dice(score, opponent_score)
-        scorelist[who] += take_turn(num_rolls, opponent_score, dice)
-        if max(scorelist) == 2*min(scorelist):
-            scorelist[0], scorelist[1] = scorelist[1], scorelist[0]
+        observer.dice_selected(who, strat, num_rolls, perf_counter() - start)
+        if rules.hog_wild[score + opponent_score]:
+            observer.hog_wild(who)
+        if num_rolls == 0:
+            observer.free_bacon(who, rules.bacon[opponent_score])
+        points, swapped = play_turn(num_rolls, who, scorelist, rules)
+        if swapped:
+            observer.swine_swap(who)
+        observer.turn_end(who, points, scorelist[0], scorelist[1])
         who = other(who)
+    observer.game_end(scorelist[0], scorelist[1])
     return scorelist[0], scorelist[1]
 
 #######################
@@ -129,8 +223,10 @@ def always_roll(n):
 
 # Experiments
 
-def make_averaged(fn, num_samples=10000):
+def make_averaged(fn, num_samples=10000, exact=False):
     """Return a function that returns the average_value of FN when called.
+    If EXACT is true, FN must be roll_dice or take_turn with fair dice, and the
+    average is computed exactly from the turn score distribution instead.
 
     To implement this function, you will have to use *args syntax, a new Python
     feature introduced in this project.  See the project description.
@@ -146,7 +242,13 @@ def make_averaged(fn, num_samples=10000):
     - In the first, the player rolls a 3 then a 1, receiving a score of 1.
     - In the other, the player rolls a 5 and 6, scoring 11.
     Thus, the average value is 6.0.
+
+    >>> make_averaged(roll_dice, exact=True)(1, six_sided)
+    3.5
     """
+    if exact:
+        import exact as exact_module
+        return exact_module.make_averaged(fn)
 
     def averaged(*args):
         total = 0
@@ -155,10 +257,11 @@ def make_averaged(fn, num_samples=10000):
         return total/num_samples
     return averaged
 
-def max_scoring_num_rolls(dice=six_sided):
+def max_scoring_num_rolls(dice=six_sided, exact=False):
     """Return the number of dice (1 to 10) that gives the highest average turn
     score by calling roll_dice with the provided DICE.  Print all averages as in
     the doctest below.  Assume that dice always returns positive outcomes.
+    If EXACT is true, use exact averages for fair DICE instead of sampling.
 
     >>> dice = make_test_dice(3)
     >>> max_scoring_num_rolls(dice)
@@ -177,16 +280,17 @@ def max_scoring_num_rolls(dice=six_sided):
 
     average_list = []
     for n in range(1, 11):
-        average = make_averaged(roll_dice)(n, dice)
+        average = make_averaged(roll_dice, exact=exact)(n, dice)
         print('{} dice scores {} on average'.format(n, average))
         average_list.append(average)
     return average_list.index(max(average_list)) + 1
 
 
-def max_scoring_num_rolls_noprint_with_value(dice=six_sided):
+def max_scoring_num_rolls_noprint_with_value(dice=six_sided, exact=False):
     """Return the number of dice (1 to 10) that gives the highest average turn
     score by calling roll_dice with the provided DICE.  Print all averages as in
     the doctest below.  Assume that dice always returns positive outcomes.
+    If EXACT is true, use exact averages for fair DICE instead of sampling.
 
     >>> dice = make_test_dice(3)
     >>> max_scoring_num_rolls(dice)
@@ -205,7 +309,7 @@ def max_scoring_num_rolls_noprint_with_value(dice=six_sided):
 
     average_list = []
     for n in range(1, 11):
-        average = make_averaged(roll_dice)(n, dice)
+        average = make_averaged(roll_dice, exact=exact)(n, dice)
         #print('{} dice scores {} on average'.format(n, average))
         average_list.append(average)
     return (average_list.index(max(average_list)) + 1, max(average_list))
@@ -225,31 +329,97 @@ def average_win_rate(strategy, baseline=always_roll(5)):
     win_rate_as_player_1 = make_averaged(winner)(baseline, strategy)
     return (win_rate_as_player_0 + win_rate_as_player_1) / 2 # Average results
 
-def run_experiments():
-    """Run a series of strategy experiments and report results."""
+def adaptive_win_rate(strategy, baseline=always_roll(5), precision=0.01,
+                      confidence=0.95, decide=False, max_samples=10000,
+                      batch_size=100):
+    """Return the average win rate of STRATEGY against BASELINE, its Wilson
+    interval at CONFIDENCE, and the number of games played.
+
+    Games are played BATCH_SIZE at a time in each seat, stopping as soon as
+    the interval is within PRECISION of the win rate.  If DECIDE is true,
+    play also stops once the interval lies entirely on one side of 1/2, so
+    that the better strategy is known.  At most MAX_SAMPLES games are played
+    in each seat.  Checking after every batch makes the interval slightly
+    optimistic.
+
+    >>> rate, (low, high), games = adaptive_win_rate(always_roll(6),
+    ...                                              always_roll(1), 0.02)
+    >>> high - low <= 0.04, games < 1000
+    (True, True)
+    >>> rate, (low, high), games = adaptive_win_rate(final_strategy,
+    ...                                              decide=True)
+    >>> low > 0.5, games < 2000
+    (True, True)
+    """
+    from statistics import NormalDist
+    from stats import wilson_interval
+    z = NormalDist().inv_cdf((1 + confidence) / 2)
+    wins = games = 0
+    while games < 2 * max_samples:
+        num_games = min(batch_size, max_samples - games // 2)
+        for _ in range(num_games):
+            wins += winner(baseline, strategy) + 1 - winner(strategy, baseline)
+        games += 2 * num_games
+        low, high = wilson_interval(wins, games, z)
+        if high - low <= 2 * precision or decide and (low > 0.5 or high < 0.5):
+            break
+    return wins / games, (low, high), games
+
+def seeded(fn):
+    """Return a function that seeds the random module with its SEED keyword
+    argument and then calls FN, so that its results can be reproduced.
+
+    >>> roll = seeded(roll_dice)
+    >>> roll(10, seed=3) == roll(10, seed=3)
+    True
+    """
+    def seeded_fn(*args, seed=0):
+        import random
+        random.seed(seed)
+        return fn(*args)
+    return seeded_fn
+
+def run_experiments(workers=None, use_cache=True, seed=0):
+    """Run a series of strategy experiments and report results.  Given
+    WORKERS, win rates are computed on that many processes and reported with
+    their 95% confidence intervals.  Every experiment is seeded with SEED.
+    If USE_CACHE is true, results of earlier runs of unchanged experiments
+    with the same seed are reused.
+    """
+    max_scoring = seeded(max_scoring_num_rolls)
+    if workers:
+        import parallel
+        win_rate = lambda strategy, seed: parallel.average_win_rate(
+            strategy, workers=workers, seed=seed)
+    else:
+        win_rate = seeded(average_win_rate)
+    if use_cache:
+        from cache import cached
+        max_scoring, win_rate = cached(max_scoring), cached(win_rate)
+
     if False: # Change to False when done finding max_scoring_num_rolls
-        six_sided_max = max_scoring_num_rolls(six_sided)
+        six_sided_max = max_scoring(six_sided, seed=seed)
         print('Max scoring num rolls for six-sided dice:', six_sided_max)
-        four_sided_max = max_scoring_num_rolls(four_sided)
+        four_sided_max = max_scoring(four_sided, seed=seed)
         print('Max scoring num rolls for four-sided dice:', four_sided_max)
 
     if []: # Change to True to test always_roll(8)
-        print('always_roll(8) win rate:', average_win_rate(always_roll(8)))
+        print('always_roll(8) win rate:', win_rate(always_roll(8), seed=seed))
 
     if []: # Change to True to test bacon_strategy
-        print('bacon_strategy win rate:', average_win_rate(bacon_strategy))
+        print('bacon_strategy win rate:', win_rate(bacon_strategy, seed=seed))
 
     if []: # Change to True to test swap_strategy
-        print('swap_strategy win rate:', average_win_rate(swap_strategy))
+        print('swap_strategy win rate:', win_rate(swap_strategy, seed=seed))
 
     if True: # Change to True to test final_strategy
-        print('final_strategy win rate:', average_win_rate(final_strategy))
+        print('final_strategy win rate:', win_rate(final_strategy, seed=seed))
 
     "*** You may add additional experiments as you wish ***"
 
 # Strategies
 
-bacon = lambda x: max([int(a) + 1 for a in str(x)])
+bacon = free_bacon
 def bacon_strategy(score, opponent_score, margin=8, num_rolls=5):
     """This strategy rolls 0 dice if that gives at least MARGIN points,
     and rolls NUM_ROLLS otherwise.
@@ -268,7 +438,7 @@ def swap_check(score, opponent_score):
     if debug: print('Bacon:', bacon(opponent_score))
     score_after_bacon = score + bacon(opponent_score)
 
-    if max(score_after_bacon, opponent_score) == 2* min(score_after_bacon, opponent_score):
+    if is_swap(score_after_bacon, opponent_score):
         return opponent_score
     else:
         return False
@@ -279,7 +449,7 @@ def good_swap_check(score, opponent_score):
     
 
 def hogwild_check(score, opponent_score):
-    return (score + opponent_score) % 7 == 0
+    return is_hog_wild(score, opponent_score)
 
 def swap_strategy(score, opponent_score, margin=8, num_rolls=5):
     """This strategy rolls 0 dice when it would result in a beneficial swap and
@@ -288,7 +458,8 @@ def swap_strategy(score, opponent_score, margin=8, num_rolls=5):
     NUM_ROLLS otherwise.
     """
 
-    score_after_bacon = score + bacon(opponent_score)
+    points = bacon(opponent_score)
+    score_after_bacon = score + points
     swap_value = swap_check(score, opponent_score)
 
     if debug: print('Swap value:', swap_value)
@@ -298,7 +469,7 @@ def swap_strategy(score, opponent_score, margin=8, num_rolls=5):
         if debug: print(' #If rolling 0 would result in a beneficial swap, do it.')
         return 0
     #If rolling 0 would not result in a swap, but would score above the margin, do it.
-    elif (not swap_value) and (bacon(opponent_score) > margin):
+    elif (not swap_value) and (points > margin):
         if debug: print(' #If rolling 0 would not result in a swap, but would score above the margin, do it.')
         return 0
     #In all other cases, roll the default number of times.
@@ -308,6 +479,15 @@ def swap_strategy(score, opponent_score, margin=8, num_rolls=5):
 
 
 
+def bacon_threshold(score, opponent_score):
+    """Return how many points Free bacon must beat the default roll by for
+    final_strategy to take it: none when the player is not behind, and more
+    the further behind the player is."""
+    if score >= opponent_score:
+        return 0
+    else:
+        return 1 + (opponent_score - score) // 10
+
 def final_strategy(score, opponent_score):
     """A brief description of a strategy.
 
@@ -321,18 +501,13 @@ def final_strategy(score, opponent_score):
     Otherwise, roll 0
     """
 
-    def bacon_threshold(score, opponent_score):
-        if score >= opponent_score:
-            return 0
-        else:
-            return 1 + (opponent_score - score) // 10
-    
     default_roll, default_value =\
             (4, 4.47) if hogwild_check(score, opponent_score) else (6, 8.69)
 
-    if (good_swap_check(score + bacon(opponent_score), opponent_score) or\
-            hogwild_check(score + bacon(opponent_score), opponent_score) or\
-            bacon(opponent_score) > default_value + bacon_threshold(score, opponent_score)):
+    points = bacon(opponent_score)
+    if (good_swap_check(score + points, opponent_score) or\
+            hogwild_check(score + points, opponent_score) or\
+            points > default_value + bacon_threshold(score, opponent_score)):
         return 0
     else:
         return default_roll
@@ -355,17 +530,169 @@ def final_strategy(score, opponent_score):
 #       of Python not yet covered in the course.
 
 
+def strategy_named(name):
+    """Return the strategy registered in tournament.STRATEGIES as NAME, or the
+    policy saved in the policy file at NAME.
+
+    >>> strategy_named('always_roll(3)')(0, 0)
+    3
+    """
+    import tournament
+    if name in tournament.STRATEGIES:
+        return tournament.STRATEGIES[name]
+    import os
+    assert os.path.exists(name), 'Unknown strategy {}; choose from {}'.format(
+        name, ', '.join(tournament.STRATEGIES))
+    from policy import load_policy
+    return load_policy(name)
+
+def simulate_command(args):
+    """Return the win rate of ARGS.strategy against ARGS.opponent, from games
+    simulated by play on ARGS.workers processes."""
+    import parallel
+    rate, (low, high) = parallel.average_win_rate(
+        strategy_named(args.strategy), strategy_named(args.opponent),
+        args.num_samples, args.workers, args.seed)
+    return {'strategy': args.strategy, 'opponent': args.opponent,
+            'method': 'simulate', 'win_rate': rate, 'interval': [low, high],
+            'games': 2 * args.num_samples, 'seed': args.seed}
+
+def evaluate_command(args):
+    """Return the win rate of ARGS.strategy against ARGS.opponent, computed
+    exactly by the solver, or estimated by the batch engine if
+    ARGS.monte_carlo is true."""
+    strategy = strategy_named(args.strategy)
+    opponent = strategy_named(args.opponent)
+    result = {'strategy': args.strategy, 'opponent': args.opponent,
+              'goal': args.goal}
+    if args.monte_carlo:
+        import batch
+        result.update(method='monte-carlo', games=2 * args.num_samples,
+                      seed=args.seed, win_rate=batch.average_win_rate(
+                          strategy, opponent, args.num_samples, args.seed,
+                          standard_rules(args.goal)))
+    else:
+        from solver import win_probability
+        first = win_probability(strategy, opponent, args.goal)
+        second = 1 - win_probability(opponent, strategy, args.goal)
+        result.update(method='exact', win_rate=(first + second) / 2,
+                      as_player_0=first, as_player_1=second)
+    return result
+
+def solve_command(args):
+    """Solve Hog to ARGS.goal and save the optimal policy to ARGS.output."""
+    from policy import save_policy
+    from solver import solve
+    policy, win_chances = solve(args.goal)
+    save_policy(args.output, policy, win_chances)
+    return {'output': args.output, 'goal': args.goal,
+            'first_player_win_chance': float(win_chances[0, 0])}
+
+def tournament_command(args):
+    """Play a tournament between ARGS.strategies, or all registered
+    strategies, and return their win rates and Elo ratings."""
+    import tournament
+    names = args.strategies or list(tournament.STRATEGIES)
+    cache_path = None if args.no_cache else tournament.CACHE_PATH
+    names, rates = tournament.run_tournament(
+        {name: strategy_named(name) for name in names}, args.num_samples,
+        args.seed, cache_path)
+    if not args.json:
+        tournament.print_results(names, rates)
+    return {'strategies': names, 'win_rates': rates, 'seed': args.seed,
+            'ratings': tournament.elo_ratings(rates),
+            'games': 2 * args.num_samples}
+
+def print_result(result):
+    """Print the entries of the RESULT of a command, one per line."""
+    for key, value in result.items():
+        if isinstance(value, float):
+            value = round(value, 6)
+        elif isinstance(value, list) and all(isinstance(v, float)
+                                             for v in value):
+            value = [round(v, 6) for v in value]
+        if key not in ('win_rates', 'ratings'):
+            print('{}: {}'.format(key, value))
+
 @main
 def run(*args):
     """Read in the command-line argument and calls corresponding functions.
 
     This function uses Python syntax/techniques not yet covered in this course.
+    Experiments can be run without editing this file, for example:
+
+        python3 -m hog --workers 4 simulate final_strategy -n 10000
+        python3 -m hog evaluate final_strategy --opponent bacon_strategy --json
+        python3 -m hog solve optimal.hogp
+        python3 -m hog tournament final_strategy "always_roll(6)" -n 1000
+
+    --workers and --no_cache apply to every command, so they come before it.
     """
     import argparse
+    import json
     parser = argparse.ArgumentParser(description="Play Hog")
     parser.add_argument('--run_experiments', '-r', action='store_true',
                         help='Runs strategy experiments')
+    parser.add_argument('--workers', '-w', type=int,
+                        help='Number of processes for experiments and '
+                             'simulate (all cores by default)')
+    parser.add_argument('--no_cache', action='store_true',
+                        help='Recompute experiments and tournaments instead '
+                             'of reusing results')
+    commands = parser.add_subparsers(dest='command')
+
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument('--json', action='store_true',
+                        help='print the result as a JSON object')
+    samples = argparse.ArgumentParser(add_help=False)
+    samples.add_argument('--num_samples', '-n', type=int, default=10000,
+                         help='games played in each seat')
+    samples.add_argument('--seed', '-s', type=int, default=0,
+                         help='seed for the dice')
+    matchup = argparse.ArgumentParser(add_help=False)
+    matchup.add_argument('strategy', help='a strategy name or policy file')
+    matchup.add_argument('--opponent', '-o', default='always_roll(5)',
+                         help='the strategy to play against')
+
+    simulate = commands.add_parser('simulate', parents=[common, samples,
+                                                        matchup],
+                                   help='estimate a win rate by playing games')
+    simulate.set_defaults(handler=simulate_command)
+
+    evaluate = commands.add_parser('evaluate', parents=[common, samples,
+                                                        matchup],
+                                   help='compute a win rate exactly, or '
+                                        'estimate it on the batch engine')
+    method = evaluate.add_mutually_exclusive_group()
+    method.add_argument('--exact', dest='monte_carlo', action='store_false',
+                        help='compute the exact win rate (the default)')
+    method.add_argument('--monte-carlo', dest='monte_carlo',
+                        action='store_true',
+                        help='estimate the win rate on the batch engine')
+    evaluate.add_argument('--goal', '-g', type=int, default=GOAL_SCORE,
+                          help='score needed to win')
+    evaluate.set_defaults(handler=evaluate_command, monte_carlo=False)
+
+    solve = commands.add_parser('solve', parents=[common],
+                                help='save the optimal policy to a file')
+    solve.add_argument('output', help='path of the policy file to write')
+    solve.add_argument('--goal', '-g', type=int, default=GOAL_SCORE,
+                       help='score needed to win')
+    solve.set_defaults(handler=solve_command)
+
+    tournament = commands.add_parser('tournament', parents=[common, samples],
+                                     help='play every pair of strategies')
+    tournament.add_argument('strategies', nargs='*',
+                            help='strategy names or policy files (all '
+                                 'registered strategies by default)')
+    tournament.set_defaults(handler=tournament_command)
     args = parser.parse_args()
 
-    if args.run_experiments:
-        run_experiments()
+    if args.command:
+        result = args.handler(args)
+        if args.json:
+            print(json.dumps(result))
+        elif args.command != 'tournament':
+            print_result(result)
+    elif args.run_experiments:
+        run_experiments(args.workers, not args.no_cache)
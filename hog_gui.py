@@ -1,13 +1,31 @@
 """A graphical user interface (GUI) for the game of Hog.
+
+hog.play runs in a worker thread, so that no strategy can freeze the window.
+The worker posts what happens in the game to a queue of events, which the
+Tk main thread polls and draws.  Human moves are passed back to the worker
+through another queue.
+
+In spectator mode, games between computer strategies, either simulated or
+read from a gamelog file, are replayed turn by turn at any speed, in a
+window or as text.
 """
 
 import hog
 import dice
+import gamelog
+from observers import Observer
 from ucb import main
 
+import os
+import queue
+import sys
+import threading
+import time
+from collections import Counter, namedtuple
 import tkinter as tk
 from tkinter import *
 import argparse
+from functools import lru_cache
 
 #############
 # Utilities #
@@ -69,6 +87,19 @@ def name(who):
     """Return the name of a player."""
     return "Player {0}".format(who)
 
+IMAGE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'images')
+
+@lru_cache(maxsize=None)
+def die_image(face):
+    """Return the image of FACE, images/dieFACE.gif, decoded the first time it
+    is shown.  Four-sided dice show the same images as six-sided ones."""
+    return load_image(os.path.join(IMAGE_DIR, 'die{}.gif'.format(face)))
+
+@lru_cache(maxsize=None)
+def load_image(path):
+    """Return the image in the GIF file at PATH, decoded once."""
+    return PhotoImage(file=path) # Tkinter only works with GIFs
+
 #######
 # GUI #
 #######
@@ -81,6 +112,7 @@ class HogGUI(Frame):
     """Tkinter GUI for Hog."""
 
     KILL = -9   # kill signal to stop a game
+    POLL = 20   # milliseconds between checks for game events
 
     #########################
     # Widget Initialization #
@@ -96,6 +128,10 @@ class HogGUI(Frame):
         self.pack(fill=BOTH)
         self.parent = parent
         self.who = 0
+        self.events = queue.Queue()     # (game, kind, *args) from workers
+        self.local = threading.local()  # The game of each worker thread
+        self.game = self.waiting = None
+        self.moves, self.killed = queue.Queue(), threading.Event()
 
         self.init_scores()
         self.init_rolls()
@@ -107,6 +143,7 @@ class HogGUI(Frame):
         hog.four_sided = self.make_dice(4)
         self.computer, self.turn = computer, 0
         self.play()
+        self.poll()
 
     def init_scores(self):
         """Creates child widgets associated with scoring.
@@ -128,10 +165,9 @@ class HogGUI(Frame):
     def init_rolls(self):
         """Creates child widgets associated with the number of rolls.
 
-        The primary widget is an Entry that accepts user input. An intermediate
-        Tkinter variable, self.roll_verified, is set to the final number of
-        rolls. Once it is updated, the player immediately takes a turn based on
-        its value.
+        The primary widget is an Entry that accepts user input. Once a valid
+        number of rolls is entered, it is put on self.moves, and the player
+        immediately takes a turn based on its value.
         """
         self.roll_frame = Frame(self).pack()
 
@@ -140,26 +176,22 @@ class HogGUI(Frame):
                                 justify=CENTER).pack()
         self.roll_entry.bind('<Return>',
                              lambda event: self.roll_button.invoke())
-        self.roll_verified = IntVar()
         self.roll_button = Button(self.roll_frame,
                                   text='Roll!',
                                   command=self.roll).pack()
 
     def init_dice(self):
         """Creates child widgets associated with dice. Each dice is stored in a
-        Label. Dice Labels will be packed or unpacked depending on how many dice
-        are rolled.
+        Label, made the first time that many dice are rolled. Dice Labels will
+        be packed or unpacked depending on how many dice are rolled, and
+        self.faces holds the face each Label shows.
         """
         self.dice_frames = [
             Frame(self).pack(),
             Frame(self).pack()
         ]
-        self.dice = {
-            i: Label(self.dice_frames[i//5]).
-                    config(image=HogGUI.IMAGES[6]).
-                    pack(side=LEFT)
-            for i in range(10)
-        }
+        self.dice, self.faces = [], []
+        self.dice_count = 0
 
     def init_status(self):
         """Creates child widgets associated with the game status. For example,
@@ -175,26 +207,56 @@ class HogGUI(Frame):
     # Game Logic #
     ##############
 
+    def post(self, kind, *args):
+        """Called by a worker to post an event of KIND about its game, to be
+        drawn by the show_KIND method on the main thread."""
+        self.events.put((self.local.game, kind) + args)
+
+    def poll(self):
+        """Draw the events posted for the current game, then poll again
+        after POLL milliseconds.  Events of earlier games are dropped."""
+        try:
+            while True:
+                game, kind, *args = self.events.get_nowait()
+                if game == self.game:
+                    getattr(self, 'show_' + kind)(*args)
+        except queue.Empty:
+            pass
+        self.poll_id = self.after(HogGUI.POLL, self.poll)
+
     def make_dice(self, sides):
         """Creates a dice function that hooks to the GUI and wraps
-        dice.make_fair_dice.
+        dice.make_fair_dice.  It is called by the worker thread, so it posts
+        each outcome instead of drawing it.
 
         sides -- number of sides for the die
         """
         fair_dice = dice.make_fair_dice(sides)
         def gui_dice():
-            """Roll fair_dice and add a corresponding image to self.dice."""
+            """Roll fair_dice and post the outcome to be drawn."""
             result = fair_dice()
-            img = HogGUI.IMAGES[result]
-            self.dice[self.dice_count].config(image=img).pack(side=LEFT)
-            self.dice_count += 1
+            self.post('roll', result)
             return result
         return gui_dice
 
+    def show_roll(self, result):
+        """Show the next die showing RESULT.  Its image is only changed if it
+        showed a different face."""
+        i = self.dice_count
+        if i == len(self.dice):
+            self.dice.append(Label(self.dice_frames[i//5]))
+            self.faces.append(None)
+        if self.faces[i] != result:
+            self.dice[i].config(image=die_image(result))
+            self.faces[i] = result
+        self.dice[i].pack(side=LEFT)
+        self.dice_count += 1
+
     def clear_dice(self):
-        """Unpacks (hides) all dice Labels."""
-        for i in range(10):
+        """Unpacks (hides) the dice Labels shown since the last clear."""
+        for i in range(self.dice_count):
             self.dice[i].pack_forget()
+        self.dice_count = 0
 
     def roll(self):
         """Verify and set the number of rolls based on user input. As
@@ -202,8 +264,11 @@ class HogGUI(Frame):
         greater than or equal to 0.
         """
         result = self.roll_entry.text
-        if result.isnumeric() and 10 >= int(result) >= 0:
-            self.roll_verified.set(int(result))
+        if self.waiting is not None and result.isnumeric() and \
+                10 >= int(result) >= 0:
+            self.waiting.put(int(result))
+            self.waiting = None
+            self.roll_entry.text = ''
 
     def switch(self, who=None):
         """Switches players. self.who is either 0 or 1."""
@@ -217,80 +282,282 @@ class HogGUI(Frame):
 
     def strategy(self, score, opp_score):
         """A strategy with a hook to the GUI. This strategy gets
-        passed into the PLAY function from the HOG module. At its
-        core, the strategy waits until a number of rolls has been
-        verified, then returns that number. Game information is
-        updated as well.
+        passed into the PLAY function from the HOG module, and runs on
+        the worker thread. At its core, the strategy waits until a
+        number of rolls is put on the game's moves queue, then returns
+        that number. The computer's moves are computed right away, while
+        the GUI draws the turn, and then wait out the rest of DELAY.
 
         score     -- player's score
         opp_score -- opponent's score
         """
-        s0 = score if self.who == 0 else opp_score
-        s1 = opp_score if self.who == 0 else score
+        game = self.local
+        s0 = score if game.who == 0 else opp_score
+        s1 = opp_score if game.who == 0 else score
+        wild = hog.select_dice(score, opp_score) == hog.four_sided
+        computer = self.computer and game.who == game.computer
+        self.post('turn', game.who, s0, s1, wild, computer)
+
+        if computer:
+            start = time.perf_counter()
+            result = hog.final_strategy(score, opp_score)
+            game.killed.wait(DELAY / 1000 - (time.perf_counter() - start))
+            if game.killed.is_set():
+                result = HogGUI.KILL
+        else:
+            result = game.moves.get()
+        if result == HogGUI.KILL:
+            raise HogGUIException
+
+        self.post('chose', game.who, result)
+        game.who = 1 - game.who
+        return result
+
+    def show_turn(self, who, s0, s1, wild, computer):
+        """Show the scores at the start of WHO's turn, and wait for a
+        human player to choose a number of rolls."""
         self.s_labels[0].text = s0
         self.s_labels[1].text = s1
-        self.roll_label.text = name(self.who) +' will roll:'
+        self.roll_label.text = name(who) +' will roll:'
         status = self.status_label.text
-        if hog.select_dice(score, opp_score) == hog.four_sided:
+        if wild:
             status += ' Hog Wild!'
         self.status_label.text = status
-
-        if self.computer and self.who == self.turn:
-            self.update()
-            self.after(DELAY)
-            result = hog.final_strategy(score, opp_score)
-        else:
+        if not computer:
+            self.waiting = self.moves
             self.roll_entry.focus_set()
-            self.wait_variable(self.roll_verified)
-            result = self.roll_verified.get()
-            self.roll_entry.text = ''
-        if result == HogGUI.KILL:
-            raise HogGUIException
 
+    def show_chose(self, who, result):
+        """Show that WHO chose to roll RESULT dice, and switch players."""
         self.clear_dice()
-        self.dice_count = 0
-        self.status_label.text = '{} chose to roll {}.'.format(name(self.who),
+        self.status_label.text = '{} chose to roll {}.'.format(name(who),
                                                                result)
         self.switch()
-        return result
+
+    def show_over(self, score, opponent_score):
+        """Show the final scores and the winner."""
+        self.s_labels[0].text = score
+        self.s_labels[1].text = opponent_score
+        winner = 0 if score > opponent_score else 1
+        self.status_label.text = 'Game over! {} wins!'.format(name(winner))
 
     def play(self):
-        """Simulates a game of Hog by calling hog.play with the GUI strategies.
+        """Simulates a game of Hog by calling hog.play with the GUI strategies
+        on a new worker thread.
 
-        If the player destroys the window prematurely (i.e. in the
-        middle of a game), a HogGUIException is raised to exit out
-        of play's loop. Otherwise, the widget will be destroyed,
-        but the strategy will continue waiting.
+        If the player restarts or destroys the window in the middle of a
+        game, the game is killed: its strategy raises a HogGUIException
+        to exit out of play's loop, and its remaining events are dropped.
         """
         self.turn = 1 - self.turn
         self.switch(0)
         self.s_labels[0].text = '0'
         self.s_labels[1].text = '0'
         self.status_label.text = ''
-        try:
-            score, opponent_score = hog.play(self.strategy,
-                                             self.strategy)
-        except HogGUIException:
-            pass
-        else:
-            self.s_labels[0].text = score
-            self.s_labels[1].text = opponent_score
-            winner = 0 if score > opponent_score else 1
-            self.status_label.text = 'Game over! {} wins!'.format(
-                                        name(winner))
+        self.game = game = object()
+        moves, killed, computer = self.moves, self.killed, self.turn
+
+        def run_game():
+            self.local.game, self.local.who = game, 0
+            self.local.moves, self.local.killed = moves, killed
+            self.local.computer = computer
+            try:
+                score, opponent_score = hog.play(self.strategy,
+                                                 self.strategy)
+            except HogGUIException:
+                pass
+            else:
+                self.post('over', score, opponent_score)
+        threading.Thread(target=run_game, daemon=True).start()
+
+    def kill(self):
+        """Kills the current game, and makes new queues for the next one."""
+        self.moves.put(HogGUI.KILL)
+        self.killed.set()
+        self.moves, self.killed = queue.Queue(), threading.Event()
+        self.waiting = None
 
     def restart(self):
         """Kills the current game and begins another game."""
-        self.roll_verified.set(HogGUI.KILL)
+        self.kill()
         self.status_label.text = ''
         self.clear_dice()
         self.play()
 
     def destroy(self):
         """Overrides the destroy method to end the current game."""
-        self.roll_verified.set(HogGUI.KILL)
+        self.kill()
+        self.after_cancel(self.poll_id)
         super().destroy()
 
+#############
+# Spectator #
+#############
+
+Turn = namedtuple('Turn', ['game', 'number', 'who', 'num_rolls', 'points',
+                           'wild', 'swap', 'score0', 'score1', 'over'])
+
+class TurnRecorder(Observer):
+    """An observer that appends a Turn to TURNS for each turn of game GAME."""
+
+    def __init__(self, turns, game):
+        self.turns, self.game = turns, game
+
+    def turn_start(self, who, score, opponent_score):
+        self.wild = self.swap = False
+
+    def dice_selected(self, who, strategy, num_rolls, seconds):
+        self.num_rolls = num_rolls
+
+    def hog_wild(self, who):
+        self.wild = True
+
+    def swine_swap(self, who):
+        self.swap = True
+
+    def turn_end(self, who, points, score0, score1):
+        self.turns.append(Turn(self.game, len(self.turns) + 1, who,
+                               self.num_rolls, points, self.wild, self.swap,
+                               score0, score1, False))
+
+    def game_end(self, score0, score1):
+        self.turns[-1] = self.turns[-1]._replace(over=True)
+
+def game_turns(games):
+    """Yield the Turns of each gamelog.Game in GAMES, by replaying it."""
+    for number, game in enumerate(games):
+        turns = []
+        gamelog.replay(game, TurnRecorder(turns, number))
+        yield from turns
+
+def describe(turn):
+    """Return a line of text that describes TURN.
+
+    >>> describe(Turn(2, 7, 1, 0, 5, True, True, 40, 20, False))
+    'Game 2, turn 7: Player 1 rolls 0 (Hog Wild!) for 5 points. Swine swap! 40-20'
+    >>> describe(Turn(2, 8, 0, 4, 12, False, False, 52, 100, True))
+    'Game 2, turn 8: Player 0 rolls 4 for 12 points. 52-100 Game over! Player 1 wins!'
+    """
+    line = 'Game {}, turn {}: {} rolls {}'.format(turn.game, turn.number,
+                                                 name(turn.who), turn.num_rolls)
+    if turn.wild:
+        line += ' (Hog Wild!)'
+    line += ' for {} points.'.format(turn.points)
+    if turn.swap:
+        line += ' Swine swap!'
+    line += ' {}-{}'.format(turn.score0, turn.score1)
+    if turn.over:
+        winner = 0 if turn.score0 > turn.score1 else 1
+        line += ' Game over! {} wins!'.format(name(winner))
+    return line
+
+def shown_turns(turns, skip=0):
+    """Yield the TURNS to show when SKIP turns are skipped after each one
+    shown.  The last turn of every game is always shown.
+
+    >>> turns = [Turn(0, n, 0, 1, 1, False, False, 0, 0, n == 5)
+    ...          for n in range(1, 6)]
+    >>> [turn.number for turn in shown_turns(turns, 1)]
+    [1, 3, 5]
+    """
+    skipped = skip
+    for turn in turns:
+        if skipped >= skip or turn.over:
+            skipped = 0
+            yield turn
+        else:
+            skipped += 1
+
+def watch_text(turns, speed=0, skip=0, out=sys.stdout):
+    """Write a line for each turn of TURNS shown with SKIP, SPEED seconds
+    apart, to OUT, followed by a summary of all the games.
+
+    >>> games = gamelog.play_games(hog.final_strategy, hog.always_roll(5), 3)
+    >>> watch_text(game_turns(games), skip=1000, out=sys.stdout)
+    Game 0, turn 1: Player 0 rolls 4 (Hog Wild!) for 1 points. 1-0
+    Game 0, turn 21: Player 0 rolls 0 (Hog Wild!) for 10 points. 102-90 Game over! Player 0 wins!
+    Game 1, turn 28: Player 1 rolls 5 for 19 points. 96-103 Game over! Player 1 wins!
+    Game 2, turn 26: Player 1 rolls 5 for 26 points. 51-113 Game over! Player 1 wins!
+    3 games, 75 turns: Player 0 won 1 (33.3%), 18 Hog Wild turns, 3 Swine swaps
+    """
+    counts = Counter()
+    def count(turns):
+        for turn in turns:
+            counts['turns'] += 1
+            counts['wild'] += turn.wild
+            counts['swap'] += turn.swap
+            if turn.over:
+                counts['games'] += 1
+                counts['wins'] += turn.score0 > turn.score1
+            yield turn
+
+    for turn in shown_turns(count(turns), skip):
+        print(describe(turn), file=out)
+        if speed:
+            time.sleep(speed)
+    print('{} games, {} turns: {} won {} ({:.1%}), {} Hog Wild turns, '
+          '{} Swine swaps'.format(counts['games'], counts['turns'], name(0),
+                                  counts['wins'], counts['wins'] /
+                                  max(counts['games'], 1), counts['wild'],
+                                  counts['swap']), file=out)
+
+class SpectatorGUI(HogGUI):
+    """Tkinter GUI that replays TURNS, drawing one every SPEED seconds and
+    skipping SKIP turns after each one drawn.  Game logs do not record the
+    faces rolled, so the dice show faces that add up to each turn's points.
+    """
+
+    def __init__(self, parent, turns, speed=0.5, skip=0):
+        Frame.__init__(self, parent)
+        self.pack(fill=BOTH)
+        self.parent = parent
+        self.who = 0
+
+        self.init_scores()
+        self.init_dice()
+        self.init_status()
+        self.status_label.config(wraplength=500)
+
+        self.turns = shown_turns(turns, skip)
+        self.interval = max(1, int(speed * 1000))
+        self.tick_id = None
+        self.tick()
+
+    def tick(self):
+        """Draw the next turn, and schedule the one after it."""
+        turn = next(self.turns, None)
+        if turn is None:
+            self.status_label.text = 'No more games.'
+            return
+        self.switch(turn.who)
+        self.clear_dice()
+        for face in gamelog.replay_faces(turn.num_rolls, turn.points):
+            self.show_roll(face)
+        self.s_labels[0].text = turn.score0
+        self.s_labels[1].text = turn.score1
+        self.status_label.text = describe(turn)
+        self.tick_id = self.after(self.interval, self.tick)
+
+    def destroy(self):
+        """Overrides the destroy method to stop replaying."""
+        if self.tick_id is not None:
+            self.after_cancel(self.tick_id)
+        Frame.destroy(self)
+
+def run_spectator(turns, speed=0.5, skip=0):
+    """Start the GUI to watch TURNS.
+
+    speed -- seconds between turns drawn
+    skip  -- turns skipped after each turn drawn
+    """
+    root = Tk()
+    root.title('The Game of Hog')
+    root.minsize(520, 400)
+    root.geometry("520x400")
+
+    app = SpectatorGUI(root, turns, speed, skip)
+    root.mainloop()
+
 def run_GUI(computer=False):
     """Start the GUI.
 
@@ -301,16 +568,6 @@ def run_GUI(computer=False):
     root.minsize(520, 400)
     root.geometry("520x400")
 
-    # Tkinter only works with GIFs
-    HogGUI.IMAGES = {
-        1: PhotoImage(file='images/die1.gif'),
-        2: PhotoImage(file='images/die2.gif'),
-        3: PhotoImage(file='images/die3.gif'),
-        4: PhotoImage(file='images/die4.gif'),
-        5: PhotoImage(file='images/die5.gif'),
-        6: PhotoImage(file='images/die6.gif'),
-    }
-
     app = HogGUI(root, computer)
     root.mainloop()
 
@@ -361,9 +618,34 @@ def run(*args):
                              'Computer alternates playing as player 0 and 1.',
                         action='store_true')
     parser.add_argument('-d', '--delay',
-                        help='time delay for computer, in seconds', type=int,
+                        help='time delay for computer, in seconds', type=float,
                         default=2)
+    parser.add_argument('-w', '--watch', type=int, metavar='GAMES',
+                        help='watch GAMES simulated games of final_strategy '
+                             'against always_roll(5)')
+    parser.add_argument('-l', '--log',
+                        help='watch the games recorded in a gamelog file')
+    parser.add_argument('-s', '--speed', type=float,
+                        help='time between turns watched, in seconds '
+                             '(0.5, or 0 with --headless)')
+    parser.add_argument('-k', '--skip', type=int, default=0,
+                        help='turns to skip after each turn watched')
+    parser.add_argument('--headless', action='store_true',
+                        help='print watched games as text, without a window')
     args = parser.parse_args()
     global DELAY
-    DELAY = args.delay * 1000
-    run_GUI(computer=args.final)
+    DELAY = int(args.delay * 1000)
+    if args.log:
+        games = gamelog.read_games(args.log)
+    elif args.watch is not None:
+        games = gamelog.play_games(hog.final_strategy, hog.always_roll(5),
+                                   args.watch)
+    else:
+        run_GUI(computer=args.final)
+        return
+    if args.speed is None:
+        args.speed = 0 if args.headless else 0.5
+    if args.headless:
+        watch_text(game_turns(games), args.speed, args.skip)
+    else:
+        run_spectator(game_turns(games), args.speed, args.skip)
@@ -1,5 +1,7 @@
 """The Game of Hog."""
 
+from functools import lru_cache
+
 from dice import four_sided, six_sided, make_test_dice
 from ucb import main, trace, log_current_line, interact
 from pascal import get_probabilities
@@ -319,24 +321,28 @@ def get_value(roll, score, opponent_score):
     else:
         return roll
 
+@lru_cache(maxsize=None)
+def probability_dicts():
+    """Return a dict from each (number of rolls, sides of the dice) to the
+    probabilities of each turn score, computed by pascal the first time it is
+    needed.
 
-#probability_dict_dict = {}
-#for num_rolls in range(1, 11):
-#    for dice in (4, 6):
-#        probability_dict_dict[(num_rolls, dice)] = get_probabilities(num_rolls, dice)
-#
-#with open('probdict.py', mode = 'w') as dict_file:
-#    dict_file.write(r'probability_dict_dict =\ ')
-#    dict_file.write(str(probability_dict_dict))
-
-from probdict import probability_dict_dict
+    >>> round(probability_dicts()[(6, 4)][1], 4)
+    0.822
+    """
+    probability_dict_dict = {}
+    for num_rolls in range(1, 11):
+        for dice in (4, 6):
+            probability_dict_dict[(num_rolls, dice)] = \
+                    get_probabilities(num_rolls, dice)
+    return probability_dict_dict
 
 def average_value(num_rolls, dice, score, opponent_score):
     if num_rolls == 0:
         return get_value(bacon(opponent_score), score, opponent_score)
     else:
         average = 0
-        probability_dict = probability_dict_dict[(num_rolls, dice)]
+        probability_dict = probability_dicts()[(num_rolls, dice)]
         for roll in probability_dict.keys():
             average += get_value(roll, score, opponent_score) * probability_dict[roll]
         return average
@@ -348,49 +354,33 @@ def get_future_value(roll, score, opponent_score):
     present_value = get_value(roll, score, opponent_score)
     return present_value - get_five_average(opponent_score, score+present_value)
 
+@lru_cache(maxsize=None)
 def average_future_value(num_rolls, dice, score, opponent_score):
     if num_rolls == 0:
         return get_future_value(bacon(opponent_score), score, opponent_score)
     else:
         average = 0
-        probability_dict = probability_dict_dict[(num_rolls, dice)]
+        probability_dict = probability_dicts()[(num_rolls, dice)]
         for roll in probability_dict.keys():
             average += get_future_value(roll, score, opponent_score) * probability_dict[roll]
         return average
 
-    
-#average_dict = {}
-#
-#for num_rolls in range(11):
-#    print(num_rolls)
-#    for dice in (4, 6):
-#        for score in range(100):
-#            for opponent_score in range(100):
-#                average_dict[(num_rolls, dice, score, opponent_score)] =\
-#                        average_future_value(num_rolls, dice, score, opponent_score)
-#
-#with open('average_dict.py', mode = 'w') as dict_file:
-#    dict_file.write(r'average_dict =')
-#    dict_file.write(str(average_dict))
-
-
-from average_dict import average_dict
-
-
-
 def final_strategy_shit(score, opponent_score):
     """A brief description of my strategy.
+
+    Only the averages for this state are computed, and they are remembered
+    for the next time it is asked about.
     """
 
     
     dice = 4 if (score + opponent_score)%7 == 0 else 6
     average_list = []
     for n in range(11):
-        average_list.append(average_dict[(n, dice, score, opponent_score)])
+        average_list.append(average_future_value(n, dice, score, opponent_score))
     return average_list.index(max(average_list))
 def final_strategy(score, opponent_score):
     final = final_strategy_shit(score, opponent_score)
-    terrible = average_value(final, 4 if (score + opponent_score)%7==0 else 7, score, opponent_score)
+    terrible = average_value(final, 4 if (score + opponent_score)%7==0 else 6, score, opponent_score)
     def bacon_threshold():
         return -2 if opponent_score >= score else 0
 
@@ -403,7 +393,6 @@ def final_strategy(score, opponent_score):
     
 
     
-run_experiments()
     
 
 
@@ -0,0 +1,104 @@
+"""Observers that watch games of Hog turn by turn.
+
+Pass an observer to hog.play (or to batch.play_batch) to be told what happens
+in each turn.  Observer does nothing with what it is told; subclasses
+override the methods for the events they care about.  RuleCounter counts how
+often each special rule applies and how long each strategy takes to decide,
+across as many games as it watches.
+"""
+
+from collections import Counter
+
+class Observer(object):
+    """An observer of games that ignores every event."""
+
+    def turn_start(self, who, score, opponent_score):
+        """Player WHO is about to choose a number of dice."""
+
+    def dice_selected(self, who, strategy, num_rolls, seconds):
+        """Player WHO's STRATEGY chose NUM_ROLLS dice in SECONDS seconds."""
+
+    def hog_wild(self, who):
+        """Player WHO rolls four-sided dice this turn."""
+
+    def free_bacon(self, who, points):
+        """Player WHO rolls zero dice this turn and scores POINTS."""
+
+    def swine_swap(self, who):
+        """The scores were swapped at the end of Player WHO's turn."""
+
+    def turn_end(self, who, points, score0, score1):
+        """Player WHO's turn scored POINTS, leaving scores SCORE0 and SCORE1."""
+
+    def game_end(self, score0, score1):
+        """The game ended with scores SCORE0 and SCORE1."""
+
+    def tally(self, turns, games, hog_wild, free_bacon, swine_swap):
+        """A batch of simulated turns ended: TURNS turns were taken, GAMES
+        games ended, and each special rule applied in the given number of
+        turns."""
+
+class RuleCounter(Observer):
+    """Counts turns, games and special rules, and times the decisions of each
+    strategy, keeping only their number and total time.  Strategies are told
+    apart by name, so those that share a name are counted together.
+
+    >>> import hog
+    >>> counter = RuleCounter()
+    >>> fair_dice = hog.four_sided, hog.six_sided
+    >>> hog.four_sided = hog.make_test_dice(1)
+    >>> hog.six_sided = hog.make_test_dice(3)
+    >>> hog.play(hog.always_roll(0), hog.always_roll(2), observer=counter)
+    (106, 56)
+    >>> hog.four_sided, hog.six_sided = fair_dice
+    >>> [counter.counts[key] for key in ('games', 'turns', 'free_bacon')]
+    [1, 33, 17]
+    >>> counter.decisions
+    Counter({'strategy': 33})
+    >>> scores = hog.play(hog.bacon_strategy, hog.final_strategy,
+    ...                   observer=counter)
+    >>> sorted(counter.latencies())
+    ['bacon_strategy', 'final_strategy', 'strategy']
+    """
+
+    def __init__(self):
+        self.counts = Counter()
+        self.decisions = Counter()        # Decisions by strategy name
+        self.decision_seconds = Counter() # Total decision time by strategy name
+
+    def dice_selected(self, who, strategy, num_rolls, seconds):
+        name = getattr(strategy, '__name__', strategy)
+        self.decisions[name] += 1
+        self.decision_seconds[name] += seconds
+
+    def hog_wild(self, who):
+        self.counts['hog_wild'] += 1
+
+    def free_bacon(self, who, points):
+        self.counts['free_bacon'] += 1
+
+    def swine_swap(self, who):
+        self.counts['swine_swap'] += 1
+
+    def turn_end(self, who, points, score0, score1):
+        self.counts['turns'] += 1
+
+    def game_end(self, score0, score1):
+        self.counts['games'] += 1
+
+    def tally(self, turns, games, hog_wild, free_bacon, swine_swap):
+        self.counts.update(turns=turns, games=games, hog_wild=hog_wild,
+                           free_bacon=free_bacon, swine_swap=swine_swap)
+
+    def frequencies(self):
+        """Return a dict from each special rule to the fraction of turns in
+        which it applied."""
+        turns = self.counts['turns'] or 1
+        return {rule: self.counts[rule] / turns
+                for rule in ('hog_wild', 'free_bacon', 'swine_swap')}
+
+    def latencies(self):
+        """Return a dict from each strategy name to its mean decision time in
+        seconds."""
+        return {name: self.decision_seconds[name] / count
+                for name, count in self.decisions.items()}
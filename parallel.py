@@ -0,0 +1,75 @@
+"""Simulate Hog games in parallel on a pool of worker processes.
+
+The games are split into fixed-size chunks, and each chunk seeds its own dice
+from the experiment seed and the chunk's position.  Results therefore depend
+only on the seed and the number of samples, never on the number of workers or
+on which worker ran which chunk.
+"""
+
+import random
+from concurrent.futures import ProcessPoolExecutor
+
+import hog
+from batch import strategy_table
+from dice import make_buffered_dice
+from hog import always_roll
+from stats import wilson_interval
+
+CHUNK_SIZE = 250 # Games played by a worker per task
+
+def play_games(rows0, rows1, num_games, seed):
+    """Play NUM_GAMES games with hog.play between the strategies tabulated in
+    ROWS0 and ROWS1, using dice seeded with SEED, and return the number of
+    games won by Player 0.
+    """
+    strategy0 = lambda score, opponent_score: rows0[score][opponent_score]
+    strategy1 = lambda score, opponent_score: rows1[score][opponent_score]
+    # Fresh dice, so that no outcomes buffered before seeding are used.
+    random.seed(seed)
+    saved_dice = hog.four_sided, hog.six_sided
+    hog.four_sided, hog.six_sided = make_buffered_dice(4), make_buffered_dice(6)
+    try:
+        return sum(1 - hog.winner(strategy0, strategy1)
+                   for _ in range(num_games))
+    finally:
+        hog.four_sided, hog.six_sided = saved_dice
+
+def chunks(num_samples, seed, label):
+    """Return a list of (num_games, seed) pairs that split NUM_SAMPLES games
+    into chunks, each with its own seed derived from SEED and LABEL.
+
+    >>> chunks(600, 0, 'a')
+    [(250, '0:a:0'), (250, '0:a:1'), (100, '0:a:2')]
+    """
+    return [(min(CHUNK_SIZE, num_samples - start),
+             '{}:{}:{}'.format(seed, label, start // CHUNK_SIZE))
+            for start in range(0, num_samples, CHUNK_SIZE)]
+
+def average_win_rate(strategy, baseline=always_roll(5), num_samples=10000,
+                     workers=None, seed=0):
+    """Return the average win rate (0 to 1) of STRATEGY against BASELINE and
+    its 95% confidence interval, playing NUM_SAMPLES games in each seat on
+    WORKERS processes (all cores by default; 1 plays in this process).
+
+    Both strategies must be deterministic functions of the two scores.
+
+    >>> rate, (low, high) = average_win_rate(always_roll(5), num_samples=300,
+    ...                                      workers=2, seed=1)
+    >>> (rate, low < rate < high) == (average_win_rate(always_roll(5),
+    ...     num_samples=300, workers=1, seed=1)[0], True)
+    True
+    """
+    rows = strategy_table(strategy).tolist()
+    baseline_rows = strategy_table(baseline).tolist()
+    tasks = [(rows, baseline_rows) + chunk
+             for chunk in chunks(num_samples, seed, 'first')]
+    tasks += [(baseline_rows, rows) + chunk
+              for chunk in chunks(num_samples, seed, 'second')]
+    if workers == 1:
+        results = [play_games(*task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(play_games, *zip(*tasks)))
+    half = len(tasks) // 2
+    wins = sum(results[:half]) + num_samples - sum(results[half:])
+    return wins / (2 * num_samples), wilson_interval(wins, 2 * num_samples)
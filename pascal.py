@@ -1,31 +1,33 @@
+from functools import lru_cache
+
 def generalized_pascal(n, rows):
     '''
     Generates n rows of a generalized pascal's triangle with 
     first row n long. Each entry is the sum of n entries above it.
     The entries relate to the probability of rolling a number in hog.
     '''
-    def get_entry(row, index):
-        '''Returns the entry for indices 0<=index<=len, and 0 for other numbers.'''
-        try: 
-            if index < 0:
-                raise ValueError
-            else:
-                return row[index]
-        except:
-            return 0
-    def get_next_row(row, n=n):
-        new_row = []
-        for i in range(len(row) + n - 1):
-            new_entry = sum([get_entry(row, i - k) for k in range(n)])
-            new_row.append(new_entry)
-        return new_row
-            
-    triangle = [[1] * n]
-    for i in range(rows-1):
-        triangle.append(get_next_row(triangle[-1]))
+    return [list(pascal_row(n, row)) for row in range(rows)]
 
-    return triangle
+@lru_cache(maxsize=None)
+def pascal_row(n, row):
+    '''
+    Returns row number ROW (counting from 0) of the generalized pascal's
+    triangle with first row n long, as a tuple. Rows are memoized, so each
+    is built once from the row above it.
 
+    >>> pascal_row(3, 2)
+    (1, 3, 6, 7, 6, 3, 1)
+    '''
+    if row == 0:
+        return (1,) * n
+    above = pascal_row(n, row - 1) + (0,) * (n - 1)
+    new_row, window = [], 0
+    for i, entry in enumerate(above):
+        window += entry
+        if i >= n:
+            window -= above[i - n]
+        new_row.append(window)
+    return tuple(new_row)
 
 def print_triangle(triangle):
     for line in triangle:
@@ -48,23 +50,41 @@ def sanity_check(rolls, dice):
         print('failure')
         print(pascal)
 
-def get_probabilities(rolls, dice):
+def get_counts(rolls, dice):
+    '''
+    Returns a dictionary with the number of the dice**rolls equally likely
+    outcomes that score each number in hog, given a number of rolls and a die.
+
+    >>> get_counts(2, 3)
+    {1: 5, 2: 0, 3: 0, 4: 1, 5: 2, 6: 1}
+    '''
+    counts = { n : 0 for n in range(1, rolls*dice + 1) }
+    counts[1] = dice**rolls - (dice - 1)**rolls
+    for n, count in enumerate(pascal_row(dice - 1, rolls - 1)):
+        counts[2*rolls + n] = count
+    return counts
+
+def get_probabilities(rolls, dice, exact=False):
     '''
     Returns a dictionary with the probabilities of rolling each number
-    in hog, given a number of rolls and a die. 
+    in hog, given a number of rolls and a die. The probabilities are
+    Fractions if exact is true, and floats otherwise.
+
+    >>> get_probabilities(2, 3, exact=True)[5]
+    Fraction(2, 9)
+    >>> sum(get_probabilities(100, 6, exact=True).values())
+    Fraction(1, 1)
     '''
-    pascal_list = generalized_pascal(dice - 1, rolls )[-1]
-    pascal_list = [n/(dice**rolls) for n in pascal_list]
-    probability_dict = { n : 0 for n in range(1, rolls*dice + 1) }
-    probability_dict[1] = wun(rolls, dice)
-    for n in range(len(pascal_list)):
-        probability_dict[rolls*dice - n] = pascal_list[n]
-    return probability_dict
+    from fractions import Fraction
+    total = dice**rolls
+    convert = (lambda count: Fraction(count, total)) if exact else \
+              (lambda count: count/total)
+    return { n : convert(count) for n, count in get_counts(rolls, dice).items() }
 
 
 def wun(rolls, dice):
     w = 1/dice
-    for i in range(rolls):
+    for i in range(rolls - 1):
         w = ((dice - 1)*w + 1)/dice
     return w
 
@@ -0,0 +1,72 @@
+"""A compact binary file format for Hog policies.
+
+A policy file holds a small header followed by a GOAL x GOAL table of the
+number of dice to roll (one unsigned byte each, indexed by score and then
+opponent_score) and, optionally, a GOAL x GOAL table of win chances (one
+little-endian 32-bit float each).  Loading a policy memory-maps the file, so
+it takes the same short time no matter how large the tables are.
+"""
+
+import mmap
+import struct
+import sys
+from array import array
+
+MAGIC = b'HOGP'
+VERSION = 1
+HEADER = struct.Struct('<4sBBH') # magic, version, has win chances, goal
+
+def save_policy(path, policy, win_chances=None):
+    """Write POLICY, a square 2-D array of the number of dice to roll, and
+    optionally the matching WIN_CHANCES, to the file at PATH.
+    """
+    goal = len(policy)
+    rolls = array('B', (int(n) for row in policy for n in row))
+    assert len(rolls) == goal * goal, 'A policy must be square.'
+    with open(path, 'wb') as policy_file:
+        policy_file.write(HEADER.pack(MAGIC, VERSION, win_chances is not None,
+                                      goal))
+        policy_file.write(rolls.tobytes())
+        if win_chances is not None:
+            chances = array('f', (float(p) for row in win_chances for p in row))
+            assert len(chances) == goal * goal, 'Win chances must match policy.'
+            if sys.byteorder == 'big':
+                chances.byteswap()
+            policy_file.write(chances.tobytes())
+
+def load_policy(path):
+    """Return a strategy that rolls the number of dice stored in the policy
+    file at PATH.
+
+    The strategy also has a GOAL attribute and a WIN_CHANCES attribute, which
+    is a function of the two scores, or None if the file has no win chances.
+
+    >>> import os, tempfile
+    >>> path = os.path.join(tempfile.mkdtemp(), 'policy.hogp')
+    >>> save_policy(path, [[3, 0], [1, 2]], [[0.5, 0.25], [1.0, 0.75]])
+    >>> strategy = load_policy(path)
+    >>> strategy(1, 0), strategy.goal, strategy.win_chances(0, 1)
+    (1, 2, 0.25)
+    """
+    with open(path, 'rb') as policy_file:
+        data = mmap.mmap(policy_file.fileno(), 0, access=mmap.ACCESS_READ)
+    magic, version, has_chances, goal = HEADER.unpack_from(data)
+    assert magic == MAGIC, path + ' is not a Hog policy file.'
+    assert version == VERSION, 'Unsupported policy file version.'
+    size = goal * goal
+    rolls = memoryview(data)[HEADER.size:HEADER.size + size]
+
+    def strategy(score, opponent_score):
+        return rolls[score * goal + opponent_score]
+    strategy.goal = goal
+    strategy.win_chances = None
+    if has_chances:
+        chances = memoryview(data)[HEADER.size + size:HEADER.size + 5 * size]
+        if sys.byteorder == 'big':
+            chances = array('f', chances)
+            chances.byteswap()
+        else:
+            chances = chances.cast('f')
+        strategy.win_chances = lambda score, opponent_score: \
+            chances[score * goal + opponent_score]
+    return strategy
@@ -0,0 +1,173 @@
+"""The rules of Hog, and variants of them, compiled into lookup tables.
+
+A Rules object describes one variant of the game: the goal, the sides of the
+dice rolled normally and under Hog wild, the modulus that triggers Hog wild,
+whether Swine swap is played and the most dice that may be rolled.  Its
+special rules are computed once, when it is made, into lookup tables:
+
+Free bacon:  bacon[opponent_score] is the number of points scored by rolling
+             zero dice, one more than the largest digit of opponent_score.
+Hog wild:    hog_wild[score + opponent_score] is true when the sum of the
+             scores is a multiple of the Hog wild modulus, so the wild dice
+             are rolled.
+Swine swap:  swap[score][opponent_score] is 1 when one score is double the
+             other, so the scores are swapped.
+
+STANDARD holds the rules of the project, and BACON, HOG_WILD and SWAP are its
+tables.
+
+>>> BACON[34], BACON[71], BACON[7]
+(5, 8, 8)
+>>> HOG_WILD[28], HOG_WILD[80]
+(True, False)
+>>> SWAP[20][40], SWAP[40][20], SWAP[20][41]
+(1, 1, 0)
+"""
+
+from functools import lru_cache
+
+# Every score that a game to 100 can reach, together with the Free bacon
+# lookaheads of a strategy, is below SCORE_LIMIT.
+SCORE_LIMIT = 256
+LOOKAHEAD = 20 # Points that strategies may add to a score to look ahead
+
+def bacon_table(limit):
+    """Return a tuple of Free bacon points for every score below LIMIT."""
+    return tuple(1 + max(int(c) for c in str(score)) for score in range(limit))
+
+def hog_wild_table(limit, modulus):
+    """Return a tuple that is true for every sum of two scores below LIMIT
+    that is a multiple of MODULUS.  A MODULUS of None turns Hog wild off."""
+    return tuple(bool(modulus) and total % modulus == 0
+                 for total in range(2 * limit))
+
+def swap_table(limit, swine_swap=True):
+    """Return a tuple of LIMIT rows of LIMIT bytes that are 1 where one score
+    is double the other.  If SWINE_SWAP is false, every byte is 0."""
+    def row(score):
+        row = bytearray(limit)
+        if swine_swap and 2 * score < limit:
+            row[2 * score] = 1
+        if swine_swap and score % 2 == 0:
+            row[score // 2] = 1
+        return bytes(row)
+    return tuple(row(score) for score in range(limit))
+
+class Rules(object):
+    """A variant of the rules of Hog.
+
+    goal:          The score needed to win.
+    sides:         The number of sides on the dice that are usually rolled.
+    wild_sides:    The number of sides on the dice rolled under Hog wild.
+    wild_modulus:  Hog wild applies when the sum of the scores is a multiple
+                   of this; None turns Hog wild off.
+    swine_swap:    Whether Swine swap is played.
+    max_rolls:     The most dice that may be rolled in one turn.
+
+    Rules are compared by their parameters, so they can key caches.
+
+    >>> rules = Rules(goal=50, sides=8, swine_swap=False)
+    >>> rules
+    Rules(goal=50, sides=8, wild_sides=4, wild_modulus=7, swine_swap=False, max_rolls=10)
+    >>> rules.hog_wild[21], rules.swap[10][20], rules.max_points
+    (True, 0, 80)
+    >>> rules.replace(swine_swap=True).swap[10][20]
+    1
+    >>> rules == Rules(50, 8, swine_swap=False), rules == STANDARD
+    (True, False)
+    """
+
+    PARAMETERS = ('goal', 'sides', 'wild_sides', 'wild_modulus', 'swine_swap',
+                  'max_rolls')
+
+    def __init__(self, goal=100, sides=6, wild_sides=4, wild_modulus=7,
+                 swine_swap=True, max_rolls=10):
+        assert goal > 0, 'The goal must be positive.'
+        assert sides > 1 and wild_sides > 1, 'Dice must have at least 2 sides.'
+        assert max_rolls > 0, 'Players must be able to roll at least once.'
+        self.goal, self.sides, self.wild_sides = goal, sides, wild_sides
+        self.wild_modulus, self.swine_swap = wild_modulus, swine_swap
+        self.max_rolls = max_rolls
+        self.max_points = max_rolls * max(sides, wild_sides)
+        self.limit = max(SCORE_LIMIT,
+                         goal + max(self.max_points, 10) + LOOKAHEAD)
+        self.bacon = bacon_table(self.limit)
+        self.hog_wild = hog_wild_table(self.limit, wild_modulus)
+        self.swap = swap_table(self.limit, swine_swap)
+
+    def parameters(self):
+        """Return a tuple of the parameters of these rules."""
+        return tuple(getattr(self, name) for name in self.PARAMETERS)
+
+    def replace(self, **changes):
+        """Return rules that differ from these only in CHANGES."""
+        parameters = dict(zip(self.PARAMETERS, self.parameters()))
+        parameters.update(changes)
+        if tuple(parameters[name] for name in self.PARAMETERS) == \
+           self.parameters():
+            return self
+        return make_rules(**parameters)
+
+    def __eq__(self, other):
+        return isinstance(other, Rules) and \
+               self.parameters() == other.parameters()
+
+    def __hash__(self):
+        return hash(self.parameters())
+
+    def __repr__(self):
+        return 'Rules({})'.format(', '.join(
+            '{}={!r}'.format(name, value)
+            for name, value in zip(self.PARAMETERS, self.parameters())))
+
+@lru_cache(maxsize=None)
+def make_rules(**parameters):
+    """Return Rules with these PARAMETERS, making their tables only once for
+    each distinct variant."""
+    return Rules(**parameters)
+
+def standard_rules(goal):
+    """Return the standard rules played to GOAL.
+
+    >>> standard_rules(100) is STANDARD
+    True
+    """
+    return STANDARD.replace(goal=goal)
+
+STANDARD = Rules()
+BACON, HOG_WILD, SWAP = STANDARD.bacon, STANDARD.hog_wild, STANDARD.swap
+
+# Strategies may look at scores of games to any goal, so these look up the
+# standard tables when they can and compute the rule otherwise.
+
+def free_bacon(opponent_score):
+    """Return the points scored by Free bacon against OPPONENT_SCORE.
+
+    >>> free_bacon(34), free_bacon(1234)
+    (5, 5)
+    """
+    if opponent_score < SCORE_LIMIT:
+        return BACON[opponent_score]
+    return 1 + max(int(c) for c in str(opponent_score))
+
+def is_hog_wild(score, opponent_score):
+    """Return whether four-sided dice are rolled at these scores under the
+    standard rules.
+
+    >>> is_hog_wild(20, 8), is_hog_wild(400, 206)
+    (True, False)
+    """
+    total = score + opponent_score
+    if total < 2 * SCORE_LIMIT:
+        return HOG_WILD[total]
+    return total % 7 == 0
+
+def is_swap(score, opponent_score):
+    """Return whether SCORE and OPPONENT_SCORE are swapped.
+
+    >>> is_swap(20, 40), is_swap(300, 600), is_swap(300, 601)
+    (True, True, False)
+    """
+    if score < SCORE_LIMIT and opponent_score < SCORE_LIMIT:
+        return SWAP[score][opponent_score] == 1
+    return max(score, opponent_score) == 2 * min(score, opponent_score)
@@ -0,0 +1,195 @@
+"""An optimal Hog strategy, found by value iteration over all game states.
+
+A state is the pair (score, opponent_score) of the player about to roll, with
+both scores below the goal.  The value of a state is the chance that this
+player goes on to win when both players play optimally, and a policy gives
+the number of dice to roll in every state.
+"""
+
+from functools import lru_cache
+
+import numpy as np
+
+from batch import strategy_table
+from compiled import table_strategy
+from exact import turn_distribution
+from hog import GOAL_SCORE
+from policy import save_policy
+from rules import STANDARD, standard_rules
+from ucb import main
+
+@lru_cache(maxsize=None)
+def transitions(goal=GOAL_SCORE, rules=STANDARD):
+    """Return a list with one (chances, successors) pair of arrays for each
+    number of rolls from 0 to RULES.max_rolls, for a game to GOAL under
+    RULES.  The arrays are cached and must not be changed.
+
+    Row I of both arrays describes state I = score * GOAL + opponent_score:
+    chances[I, J] is the chance of the Jth turn outcome, and successors[I, J]
+    says where that outcome leads.  A successor below GOAL * GOAL is the state
+    of the opponent, who moves next; GOAL * GOAL means the current player has
+    won and GOAL * GOAL + 1 means the current player has lost.  Free bacon,
+    Hog wild and Swine swap are applied exactly as in hog.play.
+    """
+    score, opponent_score = np.divmod(np.arange(goal * goal), goal)
+    hog_wild = np.array(rules.hog_wild)[score + opponent_score][:, None]
+    bacon = np.array(rules.bacon[:goal])
+    sides = max(rules.sides, rules.wild_sides)
+    result = []
+    for num_rolls in range(rules.max_rolls + 1):
+        if num_rolls == 0:
+            points = bacon[opponent_score][:, None]
+            chances = np.ones(points.shape)
+        else:
+            points = np.append(1, np.arange(2 * num_rolls,
+                                            sides * num_rolls + 1))
+            chances = np.where(hog_wild,
+                               _chances(num_rolls, rules.wild_sides, points),
+                               _chances(num_rolls, rules.sides, points))
+        new_score = score[:, None] + points
+        opponent = opponent_score[:, None] + 0 * points
+        swap = rules.swine_swap & (np.maximum(new_score, opponent) ==
+                                   2 * np.minimum(new_score, opponent))
+        new_score, opponent = (np.where(swap, opponent, new_score),
+                               np.where(swap, new_score, opponent))
+        successors = np.where(np.maximum(new_score, opponent) < goal,
+                              opponent * goal + new_score,
+                              np.where(new_score > opponent,
+                                       goal * goal, goal * goal + 1))
+        result.append((chances, successors))
+    return result
+
+def _chances(num_rolls, sides, points):
+    """Return the chances of scoring each of POINTS by rolling NUM_ROLLS dice
+    with SIDES sides."""
+    distribution = np.zeros(max(points.max(), num_rolls * sides) + 1)
+    chances = turn_distribution(num_rolls, sides)
+    distribution[:len(chances)] = chances
+    return distribution[points]
+
+def action_values(win_chances, moves):
+    """Return an 11 x N array of the chance of winning after each number of
+    rolls in each of the N states, given WIN_CHANCES for every state and the
+    MOVES returned by transitions."""
+    after_turn = np.append(1 - win_chances, [1.0, 0.0])
+    return np.array([(chances * after_turn[successors]).sum(axis=1)
+                     for chances, successors in moves])
+
+def solve(goal=GOAL_SCORE, tolerance=1e-12, max_iterations=10000, rules=None):
+    """Return a GOAL x GOAL policy array of the number of dice to roll and
+    a GOAL x GOAL array of the chance of winning from each state, for a
+    player who maximizes the chance of winning against an optimal opponent.
+    RULES, if given, replaces the standard rules played to GOAL.
+
+    Value iteration repeats until no win chance changes by more than
+    TOLERANCE.
+
+    >>> policy, win_chances = solve(20)
+    >>> policy.shape, policy.dtype
+    ((20, 20), dtype('uint8'))
+    >>> round(float(win_chances[0, 0]), 3)
+    0.478
+    >>> from rules import Rules
+    >>> policy, win_chances = solve(rules=Rules(goal=20, swine_swap=False))
+    >>> round(float(win_chances[0, 0]), 3)
+    0.484
+    """
+    if rules is None:
+        rules = standard_rules(goal)
+    goal = rules.goal
+    moves = transitions(goal, rules)
+    win_chances = np.full(goal * goal, 0.5)
+    for _ in range(max_iterations):
+        values = action_values(win_chances, moves)
+        new_chances = values.max(axis=0)
+        change = np.abs(new_chances - win_chances).max()
+        win_chances = new_chances
+        if change <= tolerance:
+            break
+    policy = values.argmax(axis=0).astype(np.uint8)
+    return policy.reshape(goal, goal), win_chances.reshape(goal, goal)
+
+def policy_moves(moves, policy):
+    """Return the turn outcomes of the moves chosen by POLICY, a GOAL x GOAL
+    table of rolls, from MOVES as returned by transitions.
+
+    The outcomes with any chance are listed in three flat arrays: the state
+    each comes from, its chance and its successor.
+    """
+    rolls = np.asarray(policy).ravel()
+    states, outcome_chances, outcome_successors = [], [], []
+    for num_rolls, (chances, successors) in enumerate(moves):
+        chosen = (rolls == num_rolls)[:, None] & (chances > 0)
+        states.append(np.nonzero(chosen)[0])
+        outcome_chances.append(chances[chosen])
+        outcome_successors.append(successors[chosen])
+    return (np.concatenate(states), np.concatenate(outcome_chances),
+            np.concatenate(outcome_successors))
+
+def win_probability(strategy0, strategy1, goal=GOAL_SCORE, tolerance=1e-12,
+                    max_iterations=10000, rules=None):
+    """Return the exact chance that Player 0 wins a game between STRATEGY0
+    and STRATEGY1, computed from the win chances of every state rather than
+    by simulation.  Strategies are compiled into tables first.  RULES, if
+    given, replaces the standard rules played to GOAL.
+
+    >>> from hog import always_roll, final_strategy
+    >>> round(win_probability(always_roll(1), always_roll(1), 10), 6)
+    0.545753
+    >>> round(win_probability(final_strategy, always_roll(5)), 4)
+    0.607
+    """
+    if rules is None:
+        rules = standard_rules(goal)
+    goal = rules.goal
+    moves = transitions(goal, rules)
+    states0, chances0, successors0 = policy_moves(
+        moves, strategy_table(strategy0, goal, rules.max_rolls))
+    states1, chances1, successors1 = policy_moves(
+        moves, strategy_table(strategy1, goal, rules.max_rolls))
+    size = goal * goal
+    # win_chances0[I] is the chance that Player 0 wins from state I with
+    # Player 0 about to roll; win_chances1 is the same for Player 1.
+    win_chances0 = np.full(size, 0.5)
+    win_chances1 = np.full(size, 0.5)
+    for _ in range(max_iterations):
+        after_turn = np.append(1 - win_chances1, [1.0, 0.0])
+        new_chances0 = np.bincount(states0, chances0 * after_turn[successors0],
+                                   size)
+        after_turn = np.append(1 - new_chances0, [1.0, 0.0])
+        new_chances1 = np.bincount(states1, chances1 * after_turn[successors1],
+                                   size)
+        change = max(np.abs(new_chances0 - win_chances0).max(),
+                     np.abs(new_chances1 - win_chances1).max())
+        win_chances0, win_chances1 = new_chances0, new_chances1
+        if change <= tolerance:
+            break
+    return float(win_chances0[0])
+
+def policy_strategy(policy):
+    """Return a strategy that rolls the number of dice given by POLICY, a
+    2-D array indexed by [score, opponent_score].
+
+    >>> strategy = policy_strategy(np.array([[3, 0], [1, 2]], dtype=np.uint8))
+    >>> strategy(1, 0)
+    1
+    """
+    return table_strategy(policy)
+
+##########################
+# Command Line Interface #
+##########################
+
+@main
+def run(*args):
+    """Solve Hog and write the optimal policy to a policy file."""
+    import argparse
+    parser = argparse.ArgumentParser(description='Solve Hog')
+    parser.add_argument('output', help='path of the policy file to write')
+    parser.add_argument('--goal', '-g', type=int, default=GOAL_SCORE,
+                        help='score needed to win')
+    args = parser.parse_args()
+
+    policy, win_chances = solve(args.goal)
+    save_policy(args.output, policy, win_chances)
+    print('First player wins with chance', float(win_chances[0, 0]))
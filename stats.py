@@ -0,0 +1,22 @@
+"""Statistics for summarizing the results of simulated games."""
+
+from math import sqrt
+
+def wilson_interval(wins, games, z=1.96):
+    """Return the Wilson score interval (low, high) for the chance of
+    winning, after WINS wins in GAMES games.  The default Z gives a 95%
+    interval.
+
+    >>> low, high = wilson_interval(60, 100)
+    >>> round(low, 3), round(high, 3)
+    (0.502, 0.691)
+    >>> wilson_interval(0, 0)
+    (0.0, 1.0)
+    """
+    if games == 0:
+        return 0.0, 1.0
+    rate = wins / games
+    center = rate + z * z / (2 * games)
+    spread = z * sqrt(rate * (1 - rate) / games + z * z / (4 * games * games))
+    scale = 1 + z * z / games
+    return (center - spread) / scale, (center + spread) / scale
@@ -0,0 +1,156 @@
+"""A round-robin tournament between Hog strategies.
+
+Every pair of strategies plays in both seat orders on the batch engine.  The
+number of games won in each pairing is cached on disk, keyed by fingerprints
+of the two strategies and the number of games, so adding a strategy to a
+tournament only plays the pairings that include it.
+"""
+
+import hashlib
+import json
+import os
+
+from batch import strategy_table, winners
+from hog import always_roll, bacon_strategy, swap_strategy, final_strategy
+from ucb import main
+
+CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                          'tournament_cache.json')
+
+STRATEGIES = {}
+
+def register(name, strategy):
+    """Add STRATEGY to the strategies that play in tournaments as NAME."""
+    STRATEGIES[name] = strategy
+    return strategy
+
+for n in range(1, 11):
+    register('always_roll({})'.format(n), always_roll(n))
+register('bacon_strategy', bacon_strategy)
+register('swap_strategy', swap_strategy)
+register('final_strategy', final_strategy)
+
+def fingerprint(strategy):
+    """Return a string that identifies what STRATEGY does in every state.
+
+    >>> fingerprint(always_roll(5)) == fingerprint(lambda s, o: 5)
+    True
+    >>> fingerprint(always_roll(5)) == fingerprint(always_roll(6))
+    False
+    """
+    return hashlib.sha1(strategy_table(strategy).tobytes()).hexdigest()
+
+def load_cache(path):
+    """Return the cached pairing results stored at PATH, if any."""
+    if path is None or not os.path.exists(path):
+        return {}
+    with open(path) as cache_file:
+        return json.load(cache_file)
+
+def save_cache(cache, path):
+    """Store the pairing results in CACHE at PATH."""
+    if path is not None:
+        with open(path, 'w') as cache_file:
+            json.dump(cache, cache_file, indent=0, sort_keys=True)
+
+def play_pairing(table0, table1, key, num_samples, seed):
+    """Return the number of games out of NUM_SAMPLES that the strategy
+    tabulated in TABLE0 wins as Player 0 against TABLE1."""
+    digest = hashlib.sha1('{}:{}'.format(key, seed).encode()).hexdigest()
+    results = winners(table0, table1, num_samples, seed=int(digest[:16], 16))
+    return int(num_samples - results.sum())
+
+def run_tournament(strategies=None, num_samples=10000, seed=0,
+                   cache_path=CACHE_PATH):
+    """Play every pair of STRATEGIES, a dict from names to strategies (the
+    registered STRATEGIES by default), for NUM_SAMPLES games in each seat.
+
+    Return the list of names and a matrix whose [i][j] entry is the average
+    win rate of the ith strategy against the jth.
+
+    >>> names, rates = run_tournament({'four': always_roll(4),
+    ...     'six': always_roll(6), 'eight': always_roll(8)}, 100, cache_path=None)
+    >>> [round(rates[i][j] + rates[j][i], 6) for i, j in ((0, 1), (1, 2))]
+    [1.0, 1.0]
+    """
+    if strategies is None:
+        strategies = STRATEGIES
+    names = list(strategies)
+    tables = [strategy_table(strategies[name]) for name in names]
+    fingerprints = [fingerprint(table) for table in tables]
+    cache = load_cache(cache_path)
+    wins = [[None] * len(names) for _ in names]
+    for i in range(len(names)):
+        for j in range(len(names)):
+            key = '{}:{}:{}:{}'.format(fingerprints[i], fingerprints[j],
+                                       num_samples, seed)
+            if i != j and key not in cache:
+                cache[key] = play_pairing(tables[i], tables[j], key,
+                                          num_samples, seed)
+            wins[i][j] = cache.get(key)
+    save_cache(cache, cache_path)
+
+    rates = [[0.5] * len(names) for _ in names]
+    for i in range(len(names)):
+        for j in range(len(names)):
+            if i != j:
+                rates[i][j] = (wins[i][j] + num_samples - wins[j][i]) / \
+                              (2 * num_samples)
+    return names, rates
+
+def elo_ratings(rates, iterations=1000, scale=400, mean=1500):
+    """Return Elo-style ratings that best explain the win RATES matrix, so
+    that a strategy rated SCALE points above another is expected to win
+    10 games for each one it loses.
+
+    >>> ratings = elo_ratings([[0.5, 0.75], [0.25, 0.5]])
+    >>> [round(r) for r in ratings]
+    [1595, 1405]
+    """
+    ratings = [0.0] * len(rates)
+    for _ in range(iterations):
+        for i in range(len(rates)):
+            error = sum(rates[i][j] - 1 / (1 + 10 ** ((ratings[j] - ratings[i])
+                                                      / scale))
+                        for j in range(len(rates)) if j != i)
+            ratings[i] += scale / 2 * error / max(len(rates) - 1, 1)
+    shift = mean - sum(ratings) / len(ratings)
+    return [rating + shift for rating in ratings]
+
+def print_results(names, rates):
+    """Print strategies ranked by Elo rating, with their win rate matrix.
+
+    >>> print_results(['a', 'bb'], [[0.5, 0.6], [0.4, 0.5]])
+                    1     2
+     1. a  1535 0.500 0.600
+     2. bb 1465 0.400 0.500
+    """
+    ratings = elo_ratings(rates)
+    order = sorted(range(len(names)), key=lambda i: -ratings[i])
+    width = max(len(name) for name in names)
+    print(' ' * (width + 10) + ' '.join('{:>5}'.format(i + 1)
+                                        for i in range(len(order))))
+    for rank, i in enumerate(order):
+        row = ' '.join('{:5.3f}'.format(rates[i][j]) for j in order)
+        print('{:>2}. {:<{}} {:4.0f} {}'.format(rank + 1, names[i], width,
+                                                ratings[i], row))
+
+##########################
+# Command Line Interface #
+##########################
+
+@main
+def run(*args):
+    """Play a tournament between the registered strategies."""
+    import argparse
+    parser = argparse.ArgumentParser(description='Hog strategy tournament')
+    parser.add_argument('--num_samples', '-n', type=int, default=10000,
+                        help='games played per pairing in each seat')
+    parser.add_argument('--seed', '-s', type=int, default=0,
+                        help='seed for the dice')
+    parser.add_argument('--no_cache', action='store_true',
+                        help='play every pairing without the result cache')
+    args = parser.parse_args()
+
+    print_results(*run_tournament(num_samples=args.num_samples, seed=args.seed,
+                  cache_path=None if args.no_cache else CACHE_PATH))
@@ -1,11 +1,13 @@
-"""The UCB module contains functions specific to 61A projects at UC Berkeley."""
+"""The UCB module contains functions specific to 61A projects at UC Berkeley.
 
-import code
+Every program that uses main imports this module, so modules that only some
+functions need are imported by those functions.
+"""
+
+import collections
 import functools
-import inspect
-import re
-import signal
 import sys
+import time
 
 
 def main(fn):
@@ -19,12 +21,14 @@ def main(fn):
 
     Use this instead of the typical __name__ == "__main__" predicate.
     """
-    if inspect.stack()[1][0].f_locals['__name__'] == '__main__':
+    if sys._getframe(1).f_globals['__name__'] == '__main__':
         args = sys.argv[1:] # Discard the script name from command line
         fn(*args) # Call the main function
     return fn
 
 _PREFIX = ''
+_SINK = None  # A TraceSink that records traced calls instead of printing them
+_DEPTH = 0    # The number of traced calls in progress, when using a sink
 def trace(fn):
     """A decorator that prints a function's name, its arguments, and its return
     values each time the function is called. For example,
@@ -32,10 +36,27 @@ def trace(fn):
     @trace
     def compute_something(x, y):
         # function body
+
+    If a TraceSink has been set with set_trace_sink, calls are recorded there
+    instead of printed.
     """
     @functools.wraps(fn)
     def wrapped(*args, **kwds):
-        global _PREFIX
+        global _PREFIX, _DEPTH
+        sink = _SINK
+        if sink is not None:
+            record = sink.wants(fn.__name__)
+            if record:
+                reprs = sink.format_args(args, kwds)
+                start = time.perf_counter()
+            _DEPTH += 1
+            try:
+                return fn(*args, **kwds)
+            finally:
+                _DEPTH -= 1
+                if record:
+                    sink.record((fn.__name__, reprs,
+                                 time.perf_counter() - start, _DEPTH))
         reprs = [repr(e) for e in args]
         reprs += [repr(k) + '=' + repr(v) for k, v in kwds.items()]
         log('{0}({1})'.format(fn.__name__, ', '.join(reprs)) + ':')
@@ -53,8 +74,146 @@ def trace(fn):
     return wrapped
 
 
+def set_trace_sink(sink):
+    """Record traced calls in SINK, or print them again if SINK is None.
+    Return the previous sink."""
+    global _SINK
+    previous, _SINK = _SINK, sink
+    return previous
+
+
+class TraceSink(object):
+    """Records traced calls as compact events instead of printing them.
+
+    Each event is a tuple (function name, arguments, seconds, depth), where
+    depth counts the traced calls that enclose it.  Only a SAMPLE fraction
+    of calls are recorded, and if FUNCTIONS is given, only calls to the
+    functions with those names.  Sampling uses its own random number
+    generator, so tracing does not disturb seeded simulations.
+    """
+
+    def __init__(self, sample=1.0, functions=None, max_repr=80):
+        self.sample = sample
+        self.functions = None if functions is None else set(functions)
+        self.max_repr = max_repr
+        import random
+        self.random = random.Random()
+
+    def wants(self, name):
+        """Return whether to record the current call to function NAME."""
+        if self.functions is not None and name not in self.functions:
+            return False
+        return self.sample >= 1 or self.random.random() < self.sample
+
+    def format_args(self, args, kwds):
+        """Return a short string of ARGS and KWDS."""
+        reprs = [repr(e) for e in args]
+        reprs += [k + '=' + repr(v) for k, v in kwds.items()]
+        text = ', '.join(reprs)
+        if len(text) > self.max_repr:
+            text = text[:self.max_repr - 3] + '...'
+        return text
+
+    def record(self, event):
+        """Record EVENT.  TraceSink ignores it; subclasses keep it."""
+
+
+class RingBufferSink(TraceSink):
+    """Keeps the most recent CAPACITY events in memory.
+
+    >>> sink = RingBufferSink(capacity=2)
+    >>> @trace
+    ... def double(x):
+    ...     return 2 * x
+    >>> previous = set_trace_sink(sink)
+    >>> double(1), double(2), double(3)
+    (2, 4, 6)
+    >>> previous = set_trace_sink(previous)
+    >>> [(name, args, depth) for name, args, seconds, depth in sink.events]
+    [('double', '2', 0), ('double', '3', 0)]
+    """
+
+    def __init__(self, capacity=100000, **kwds):
+        super().__init__(**kwds)
+        self.events = collections.deque(maxlen=capacity)
+
+    def record(self, event):
+        self.events.append(event)
+
+
+class JSONLSink(TraceSink):
+    """Writes events to the file at PATH as lines of JSON.  Events are
+    queued and written by a background thread every INTERVAL seconds.  Close
+    the sink, or use it in a with statement, to write the rest and stop the
+    thread; a sink that is still open when Python exits is closed then.
+
+    >>> import json, os, tempfile
+    >>> path = os.path.join(tempfile.mkdtemp(), 'trace.jsonl')
+    >>> @trace
+    ... def double(x):
+    ...     return 2 * x
+    >>> with JSONLSink(path) as sink:
+    ...     previous = set_trace_sink(sink)
+    ...     double(1), double(2)
+    ...     previous = set_trace_sink(previous)
+    (2, 4)
+    >>> with open(path) as lines:
+    ...     [(e['fn'], e['args']) for e in map(json.loads, lines)]
+    [('double', '1'), ('double', '2')]
+    >>> os.remove(path)
+    """
+
+    def __init__(self, path, interval=0.5, **kwds):
+        import atexit
+        import threading
+        super().__init__(**kwds)
+        self.file = open(path, 'a')
+        self.queue = collections.deque()
+        self.interval = interval
+        self.done = threading.Event()
+        self.thread = threading.Thread(target=self._flush_loop, daemon=True)
+        self.thread.start()
+        atexit.register(self.close)
+
+    def record(self, event):
+        self.queue.append(event)
+
+    def _flush(self):
+        import json
+        lines = []
+        while self.queue:
+            name, args, seconds, depth = self.queue.popleft()
+            lines.append(json.dumps({'fn': name, 'args': args,
+                                     'seconds': seconds, 'depth': depth}))
+        if lines:
+            self.file.write('\n'.join(lines) + '\n')
+            self.file.flush()
+
+    def _flush_loop(self):
+        while not self.done.wait(self.interval):
+            self._flush()
+
+    def close(self):
+        """Write all queued events and close the file."""
+        import atexit
+        if self.file.closed:
+            return
+        atexit.unregister(self.close)
+        self.done.set()
+        self.thread.join()
+        self._flush()
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
 def log(message):
     """Print an indented message (used with trace)."""
+    import re
     if type(message) is not str:
         message = str(message)
     print(_PREFIX + re.sub('\n', '\n' + _PREFIX, message))
@@ -62,6 +221,7 @@ def log(message):
 
 def log_current_line():
     """Print information about the current line of code."""
+    import inspect
     frame = inspect.stack()[1]
     log('Current line: File "{f[1]}", line {f[2]}, in {f[3]}'.format(f=frame))
 
@@ -75,6 +235,10 @@ def interact(msg=None):
       <Control>-Z <Enter> exists the interactive session and returns to normal
       execution.
     """
+    import code
+    import inspect
+    import signal
+
     # use exception trick to pick up the current frame
     try:
         raise None